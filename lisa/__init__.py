@@ -18,9 +18,14 @@ Core Modules:
 __version__ = "2.0.0"
 __author__ = "LISA Development Team"
 
-from .config import Config, config
+from .config import Config
 from .diary import Diary
-from .mlflow_manager import MLflowManager, mlflow_manager
+from .mlflow_manager import MLflowManager
+
+# The imports above also bind the submodules as package attributes, which would
+# shadow __getattr__ below; drop them so lisa.config and lisa.mlflow_manager are
+# the singleton instances, as they were before they became lazy
+del config, mlflow_manager
 
 __all__ = [
     'Config',
@@ -30,3 +35,14 @@ __all__ = [
     'mlflow_manager',
     '__version__',
 ]
+
+
+def __getattr__(name):
+    # Global singletons are constructed on first access, not on import
+    if name == 'config':
+        from .config import config
+        return config
+    if name == 'mlflow_manager':
+        from .mlflow_manager import mlflow_manager
+        return mlflow_manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
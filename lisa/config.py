@@ -4,108 +4,196 @@ LISA Configuration Management
 Loads and manages configuration from lisa_config.yaml
 """
 
+import copy
 import os
-import yaml
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Optional
+
+# PyYAML is imported on the first config load rather than at module import
+_yaml = None
+_YAML_LOADER = None
+
+
+def _get_yaml():
+    """Import PyYAML once and resolve the fastest available safe loader"""
+    global _yaml, _YAML_LOADER
+    if _yaml is None:
+        import yaml
+        # Prefer the libyaml-backed loader; fall back to pure Python if libyaml is absent
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yaml = yaml
+    return _yaml
+
+
+# Used when no lisa_config.yaml is found. Only the top level is read-only, so each
+# load works on its own deep copy and callers mutating a section cannot alter it
+_DEFAULT_CONFIG = MappingProxyType({
+    'project': {
+        'name': 'lisa-ml-project',
+        'base_dir': '.'
+    },
+    'paths': {
+        'data': 'data/',
+        'diary': 'lisa/lisas_diary',
+        'laboratory': 'lisa/lisas_laboratory',
+        'mlruns': 'lisa/mlruns'
+    },
+    'mlflow': {
+        'tracking_uri': 'file:./lisa/mlruns',
+        'experiment_name': 'default-experiment'
+    },
+    'stopping_criteria': {
+        'performance': {
+            'enabled': True,
+            'metric': 'f1_score',
+            'threshold': 0.90
+        },
+        'improvement': {
+            'enabled': True,
+            'min_improvement_percent': 1.0,
+            'window_size': 5
+        },
+        'convergence': {
+            'enabled': True,
+            'max_variance': 0.01,
+            'window_size': 10
+        },
+        'resources': {
+            'enabled': True,
+            'max_experiments': 50,
+            'max_time_hours': 24
+        }
+    },
+    'data_science': {
+        'large_dataset_threshold_mb': 500,
+        'chunk_size_rows': 10000,
+        'max_features_for_viz': 20,
+        'random_seed': 42
+    }
+})
 
 
 class Config:
     """Singleton configuration manager for LISA"""
 
     _instance: Optional['Config'] = None
+    _initialized: bool = False
     _config: Dict[str, Any] = {}
+    _config_flat: Dict[str, Any] = {}
+    _path_cache: Dict[str, Path] = {}
     _base_dir: Path = Path(".")
 
+    # Last discovered config file and the working directory it was found from
+    _config_path_cache: Optional[str] = None
+    _config_path_cwd: Optional[str] = None
+
+    # Derived values cached on the instance; dropped whenever the config is reloaded
+    _CACHED_PROPERTIES = (
+        'project_name',
+        'random_seed',
+        'mlflow_tracking_uri',
+        'mlflow_experiment_name',
+    )
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
+            # A new instance (first use, or after _instance was reset) has loaded nothing yet
+            cls._initialized = False
         return cls._instance
 
     def __init__(self):
-        if not self._config:
-            self.load_config()
+        # __init__ runs on every Config() call; it loads until one load succeeds
+        if Config._initialized:
+            return
+        self.load_config()
 
     def load_config(self, config_path: Optional[str] = None):
         """Load configuration from YAML file"""
+        # Until this load succeeds the next Config() call loads again
+        Config._initialized = False
+
         if config_path is None:
             # Try to find lisa_config.yaml in current directory or parent
             config_path = self._find_config_file()
 
         if config_path and os.path.exists(config_path):
+            yaml = _get_yaml()
             with open(config_path, 'r') as f:
-                self._config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YAML_LOADER)
 
             # Set base directory
-            base_dir = self._config.get('project', {}).get('base_dir', '.')
-            self._base_dir = Path(base_dir).resolve()
+            base_dir = config.get('project', {}).get('base_dir', '.')
+            base_dir = Path(os.path.abspath(base_dir))
         else:
             # Use default configuration
-            self._config = self._default_config()
-            self._base_dir = Path(".").resolve()
+            config = copy.deepcopy(dict(_DEFAULT_CONFIG))
+            base_dir = Path(os.getcwd())
+
+        # Derived state is built before anything is assigned, so a failed load
+        # leaves the previous configuration intact
+        config_flat = self._flatten(config)
+        path_cache = {
+            key: self._compute_path(key, config_flat, base_dir)
+            for key in (config.get('paths') or {})
+        }
+
+        self._config = config
+        self._base_dir = base_dir
+        self._config_flat = config_flat
+        self._path_cache = path_cache
+
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+
+        Config._initialized = True
+
+    @staticmethod
+    def _flatten(config: Dict[str, Any]) -> Dict[str, Any]:
+        """Map every dot-separated key path (leaves and sections) to its value"""
+        flat = {}
+        stack = [('', config)]
+
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                if not isinstance(key, str):
+                    continue
+                path = f"{prefix}{key}"
+                flat[path] = value
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+
+        return flat
 
     def _find_config_file(self) -> Optional[str]:
         """Find lisa_config.yaml in current or parent directories"""
-        current = Path(".").resolve()
+        current = os.getcwd()
+
+        # Reuse the previous lookup unless the working directory changed
+        if Config._config_path_cache is not None and Config._config_path_cwd == current:
+            return Config._config_path_cache
+
+        found = None
 
         # Check current directory
-        config_file = current / "lisa_config.yaml"
-        if config_file.exists():
-            return str(config_file)
-
-        # Check parent directory
-        parent_config = current.parent / "lisa_config.yaml"
-        if parent_config.exists():
-            return str(parent_config)
-
-        return None
-
-    def _default_config(self) -> Dict[str, Any]:
-        """Return default configuration"""
-        return {
-            'project': {
-                'name': 'lisa-ml-project',
-                'base_dir': '.'
-            },
-            'paths': {
-                'data': 'data/',
-                'diary': 'lisa/lisas_diary',
-                'laboratory': 'lisa/lisas_laboratory',
-                'mlruns': 'lisa/mlruns'
-            },
-            'mlflow': {
-                'tracking_uri': 'file:./lisa/mlruns',
-                'experiment_name': 'default-experiment'
-            },
-            'stopping_criteria': {
-                'performance': {
-                    'enabled': True,
-                    'metric': 'f1_score',
-                    'threshold': 0.90
-                },
-                'improvement': {
-                    'enabled': True,
-                    'min_improvement_percent': 1.0,
-                    'window_size': 5
-                },
-                'convergence': {
-                    'enabled': True,
-                    'max_variance': 0.01,
-                    'window_size': 10
-                },
-                'resources': {
-                    'enabled': True,
-                    'max_experiments': 50,
-                    'max_time_hours': 24
-                }
-            },
-            'data_science': {
-                'large_dataset_threshold_mb': 500,
-                'chunk_size_rows': 10000,
-                'max_features_for_viz': 20,
-                'random_seed': 42
-            }
-        }
+        config_file = os.path.join(current, "lisa_config.yaml")
+        if os.path.exists(config_file):
+            found = config_file
+        else:
+            # Check parent directory
+            parent_config = os.path.join(os.path.dirname(current), "lisa_config.yaml")
+            if os.path.exists(parent_config):
+                found = parent_config
+
+        # Only hits are cached so a config file created later is still discovered
+        if found is not None:
+            Config._config_path_cache = found
+            Config._config_path_cwd = current
+
+        return found
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -115,16 +203,17 @@ class Config:
             config.get('mlflow.experiment_name')
             config.get('stopping_criteria.performance.threshold')
         """
-        keys = key_path.split('.')
-        value = self._config
+        return self._config_flat.get(key_path, default)
 
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
+    def get_many(self, key_paths: Iterable[str], default: Any = None) -> Dict[str, Any]:
+        """
+        Get several configuration values by dot-separated path in one call
 
-        return value
+        Example:
+            config.get_many(['mlflow.tracking_uri', 'mlflow.experiment_name'])
+        """
+        flat = self._config_flat
+        return {key_path: flat.get(key_path, default) for key_path in key_paths}
 
     def get_path(self, path_key: str) -> Path:
         """
@@ -134,34 +223,58 @@ class Config:
             config.get_path('data')  # Returns Path to data directory
             config.get_path('diary')  # Returns Path to lisas_diary
         """
-        relative_path = self.get(f'paths.{path_key}', path_key)
-        return (self._base_dir / relative_path).resolve()
+        path = self._path_cache.get(path_key)
+        if path is None:
+            path = self._compute_path(path_key)
+        return path
+
+    def _compute_path(
+        self,
+        path_key: str,
+        config_flat: Optional[Dict[str, Any]] = None,
+        base_dir: Optional[Path] = None
+    ) -> Path:
+        """Resolve a configured (or literal) path against the base directory"""
+        if config_flat is None:
+            config_flat = self._config_flat
+        if base_dir is None:
+            base_dir = self._base_dir
+        relative_path = config_flat.get(f'paths.{path_key}', path_key)
+        return Path(os.path.abspath(base_dir / relative_path))
 
-    @property
+    @cached_property
     def project_name(self) -> str:
         """Get project name"""
         return self.get('project.name', 'lisa-ml-project')
 
-    @property
+    @cached_property
     def random_seed(self) -> int:
         """Get random seed for reproducibility"""
         return self.get('data_science.random_seed', 42)
 
-    @property
+    @cached_property
     def mlflow_tracking_uri(self) -> str:
         """Get MLflow tracking URI"""
         tracking_uri = self.get('mlflow.tracking_uri', 'file:./lisa/mlruns')
 
+        # Non-file URIs (http, databricks, sqlite, ...) are used as-is
+        if not tracking_uri.startswith('file:'):
+            return tracking_uri
+
+        path = tracking_uri[5:]  # Remove 'file:' prefix
+
+        # Already absolute (POSIX root or Windows drive letter)
+        if path.startswith('/') or (len(path) > 2 and path[1] == ':'):
+            return tracking_uri
+
         # Convert relative file:// URIs to absolute paths
-        if tracking_uri.startswith('file:'):
-            path = tracking_uri[5:]  # Remove 'file:' prefix
-            if not os.path.isabs(path):
-                abs_path = (self._base_dir / path).resolve()
-                tracking_uri = f'file:{abs_path}'
+        if not os.path.isabs(path):
+            abs_path = os.path.abspath(self._base_dir / path)
+            tracking_uri = f'file:{abs_path}'
 
         return tracking_uri
 
-    @property
+    @cached_property
     def mlflow_experiment_name(self) -> str:
         """Get MLflow experiment name"""
         return self.get('mlflow.experiment_name', 'default-experiment')
@@ -174,5 +287,10 @@ class Config:
         return f"Config(project={self.project_name}, base_dir={self._base_dir})"
 
 
-# Global singleton instance
-config = Config()
+def __getattr__(name: str) -> Any:
+    """Construct the global singleton instance on first access"""
+    if name == 'config':
+        instance = Config()
+        globals()['config'] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,63 @@
+"""
+Numeric kernels for the campaign stopping checks
+
+JIT-compiled with Numba when it is installed (compiled code is cached on
+disk, so the compile cost is paid once per machine); otherwise the NumPy
+implementations are used. Both give the same results.
+"""
+
+import numpy as np
+from typing import Tuple
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _low_improvement_numpy(values: np.ndarray, min_improvement_pct: float) -> bool:
+    """True if every percentage improvement from a positive value is below the threshold"""
+    prev = values[:-1]
+    positive = prev > 0
+    improvements = (values[1:][positive] - prev[positive]) / prev[positive] * 100
+    return bool(improvements.size) and bool((improvements < min_improvement_pct).all())
+
+
+def _window_moments_numpy(values: np.ndarray) -> Tuple[float, float]:
+    """Mean and sum of squared deviations (M2) of a window"""
+    if not values.size:
+        return 0.0, 0.0
+    mean = float(values.mean())
+    return mean, float(((values - mean) ** 2).sum())
+
+
+if HAS_NUMBA:
+    # No fastmath: it would change how NaN metrics compare
+
+    @njit(cache=True)
+    def low_improvement(values, min_improvement_pct):
+        """True if every percentage improvement from a positive value is below the threshold"""
+        found = False
+        for i in range(1, values.shape[0]):
+            prev = values[i - 1]
+            if prev > 0:
+                if not (values[i] - prev) / prev * 100 < min_improvement_pct:
+                    return False
+                found = True
+        return found
+
+    @njit(cache=True)
+    def window_moments(values):
+        """Mean and sum of squared deviations (M2) of a window, in one Welford pass"""
+        mean = 0.0
+        m2 = 0.0
+        for i in range(values.shape[0]):
+            delta = values[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (values[i] - mean)
+        return mean, m2
+
+else:
+    low_improvement = _low_improvement_numpy
+    window_moments = _window_moments_numpy
@@ -5,6 +5,7 @@ This module provides callback classes for integrating tqdm progress bars
 and logging with machine learning model training.
 """
 
+import time
 from tqdm import tqdm
 from typing import Optional, Any
 
@@ -64,6 +65,18 @@ class XGBoostProgressCallback:
         self.metric_name = metric_name
         self.iteration = 0
 
+        # Redraw the bar at most ~200 times per run or every 0.1s, whichever comes first
+        self._update_every = max(1, total_rounds // 200)
+        self._last_write = 0.0
+        self._pending = 0
+        self._train_key = f'train_{metric_name}'
+        self._val_key = f'val_{metric_name}'
+        self._metrics_buf = {self._train_key: 0.0, self._val_key: 0.0}
+
+        # Bound once; __call__ runs every boosting round
+        self._pbar_update = self.pbar.update
+        self._pbar_postfix_str = self.pbar.set_postfix_str
+
     def __call__(self, env):
         """
         Called by XGBoost after each iteration.
@@ -73,17 +86,25 @@ class XGBoostProgressCallback:
         """
         # XGBoost provides evaluation_result_list: [(dataset_name, metric_name, score), ...]
         # Typically: [('train', 'logloss', 0.5), ('val', 'logloss', 0.6)]
-        if hasattr(env, 'evaluation_result_list') and len(env.evaluation_result_list) >= 2:
+        erl = getattr(env, 'evaluation_result_list', None)
+        if erl is not None and len(erl) >= 2:
             # Get train and validation metrics
-            train_metric = env.evaluation_result_list[0][2]  # (name, metric, score)
-            val_metric = env.evaluation_result_list[1][2]
-
-            # Update progress bar
-            self.pbar.set_postfix({
-                'train': f'{train_metric:.4f}',
-                'val': f'{val_metric:.4f}'
-            })
-            self.pbar.update(1)
+            train_metric = erl[0][2]  # (name, metric, score)
+            val_metric = erl[1][2]
+
+            # Update progress bar (throttled)
+            self._pending += 1
+            now = time.monotonic()
+            if self._pending >= self._update_every or now - self._last_write > 0.1:
+                # set_postfix_str skips tqdm's dict-to-string conversion;
+                # update() redraws the bar, so skip the extra refresh here
+                self._pbar_postfix_str(
+                    'train=%.4f, val=%.4f' % (train_metric, val_metric),
+                    refresh=False
+                )
+                self._pbar_update(self._pending)
+                self._pending = 0
+                self._last_write = now
 
             # Log to monitor
             if self.monitor:
@@ -97,15 +118,19 @@ class XGBoostProgressCallback:
             # Log to MLflow
             if self.mlflow_mgr:
                 try:
-                    self.mlflow_mgr.log_metric(f'train_{self.metric_name}', train_metric, step=env.iteration)
-                    self.mlflow_mgr.log_metric(f'val_{self.metric_name}', val_metric, step=env.iteration)
+                    self._metrics_buf[self._train_key] = train_metric
+                    self._metrics_buf[self._val_key] = val_metric
+                    self.mlflow_mgr.log_metrics(self._metrics_buf, step=env.iteration)
                 except Exception:
                     pass  # MLflow logging is optional
 
         self.iteration += 1
 
     def close(self):
-        """Close the progress bar."""
+        """Flush pending progress and close the progress bar."""
+        if self._pending:
+            self.pbar.update(self._pending)
+            self._pending = 0
         self.pbar.close()
 
 
@@ -134,6 +159,18 @@ class LightGBMProgressCallback:
         self.metric_name = metric_name
         self.iteration = 0
 
+        # Redraw the bar at most ~200 times per run or every 0.1s, whichever comes first
+        self._update_every = max(1, total_rounds // 200)
+        self._last_write = 0.0
+        self._pending = 0
+        self._train_key = f'train_{metric_name}'
+        self._val_key = f'val_{metric_name}'
+        self._metrics_buf = {self._train_key: 0.0, self._val_key: 0.0}
+
+        # Bound once; __call__ runs every boosting round
+        self._pbar_update = self.pbar.update
+        self._pbar_postfix_str = self.pbar.set_postfix_str
+
     def __call__(self, env):
         """
         Called by LightGBM after each iteration.
@@ -143,21 +180,29 @@ class LightGBMProgressCallback:
         """
         # LightGBM provides evaluation_result_list similar to XGBoost
         # Format: [(dataset_name, metric_name, score, is_higher_better), ...]
-        if hasattr(env, 'evaluation_result_list') and len(env.evaluation_result_list) >= 2:
+        erl = getattr(env, 'evaluation_result_list', None)
+        if erl is not None and len(erl) >= 2:
             # Get train and validation metrics
-            train_result = env.evaluation_result_list[0]
-            val_result = env.evaluation_result_list[1]
+            train_result = erl[0]
+            val_result = erl[1]
 
             # Extract scores (handle different LightGBM versions)
             train_metric = train_result[2] if len(train_result) > 2 else train_result[1]
             val_metric = val_result[2] if len(val_result) > 2 else val_result[1]
 
-            # Update progress bar
-            self.pbar.set_postfix({
-                'train': f'{train_metric:.4f}',
-                'val': f'{val_metric:.4f}'
-            })
-            self.pbar.update(1)
+            # Update progress bar (throttled)
+            self._pending += 1
+            now = time.monotonic()
+            if self._pending >= self._update_every or now - self._last_write > 0.1:
+                # set_postfix_str skips tqdm's dict-to-string conversion;
+                # update() redraws the bar, so skip the extra refresh here
+                self._pbar_postfix_str(
+                    'train=%.4f, val=%.4f' % (train_metric, val_metric),
+                    refresh=False
+                )
+                self._pbar_update(self._pending)
+                self._pending = 0
+                self._last_write = now
 
             # Log to monitor
             if self.monitor:
@@ -171,15 +216,19 @@ class LightGBMProgressCallback:
             # Log to MLflow
             if self.mlflow_mgr:
                 try:
-                    self.mlflow_mgr.log_metric(f'train_{self.metric_name}', train_metric, step=env.iteration)
-                    self.mlflow_mgr.log_metric(f'val_{self.metric_name}', val_metric, step=env.iteration)
+                    self._metrics_buf[self._train_key] = train_metric
+                    self._metrics_buf[self._val_key] = val_metric
+                    self.mlflow_mgr.log_metrics(self._metrics_buf, step=env.iteration)
                 except Exception:
                     pass  # MLflow logging is optional
 
         self.iteration += 1
 
     def close(self):
-        """Close the progress bar."""
+        """Flush pending progress and close the progress bar."""
+        if self._pending:
+            self.pbar.update(self._pending)
+            self._pending = 0
         self.pbar.close()
 
 
@@ -211,6 +260,14 @@ class GenericProgressWrapper:
         if stages is None:
             stages = ["Fitting"]
 
+        # A single stage gains nothing from a progress bar
+        if len(stages) == 1:
+            stage = stages[0]
+            print(f"{self.desc}: {stage}...")
+            if stage == "Fitting":
+                model.fit(X, y)
+            return model
+
         with tqdm(total=len(stages), desc=self.desc, leave=True) as pbar:
             for stage in stages:
                 pbar.set_description(f"{self.desc}: {stage}")
@@ -229,6 +286,7 @@ class ProgressBarManager:
     def __init__(self):
         """Initialize progress bar manager."""
         self.active_bars = []
+        self._close_fns = []
 
     def add_bar(self, pbar):
         """
@@ -239,11 +297,16 @@ class ProgressBarManager:
         """
         self.active_bars.append(pbar)
 
+        # Bind close() once so close_all() does no attribute lookups
+        close_fn = getattr(pbar, 'close', None)
+        if close_fn is not None:
+            self._close_fns.append(close_fn)
+
     def close_all(self):
         """Close all active progress bars."""
-        for pbar in self.active_bars:
-            if hasattr(pbar, 'close'):
-                pbar.close()
+        for close_fn in self._close_fns:
+            close_fn()
+        self._close_fns.clear()
         self.active_bars.clear()
 
     def __enter__(self):
@@ -5,14 +5,47 @@ Automatically discovers datasets, analyzes distributions, detects issues,
 and generates comprehensive EDA reports with visualizations.
 """
 
+import datetime
+import io
+import re
 import pandas as pd
 import numpy as np
+from joblib import Parallel, delayed
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 import warnings
+from ..config import Config
+
+try:
+    import polars as pl
+    HAS_POLARS = True
+except ImportError:
+    HAS_POLARS = False
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 warnings.filterwarnings('ignore')
 
+# Files larger than this (MB) are sampled even when no sample size is given
+LARGE_DATASET_MB = 500
+
+# Strings pandas reads as missing by default (keep_default_na), passed to Polars
+# so both CSV loaders produce the same missing-value profile
+PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null',
+]
+
+# ISO 8601 dates and datetimes (the forms PyArrow infers as date/timestamp columns)
+_ISO_DATETIME_PATTERN = r'\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?'
+_ISO_DATETIME_RE = re.compile(_ISO_DATETIME_PATTERN)
+_ISO_TIMEZONE_PATTERN = r'[T ]\d{2}:\d{2}.*(?:Z|[+-]\d{2}:?\d{2})$'
+
 
 class EDA:
     """Exploratory Data Analysis toolkit"""
@@ -68,14 +101,28 @@ class EDA:
         self,
         file_path: str,
         sample_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
         **kwargs
     ) -> pd.DataFrame:
         """
         Load a dataset with automatic format detection
 
+        CSV, Parquet and Feather files are read through a Polars lazy scan
+        with the streaming engine when Polars is installed and no pandas
+        reader arguments are given, so only the requested columns and
+        sampled rows are materialized. Files Polars cannot parse are read
+        with pandas instead.
+        Otherwise full CSV reads use pandas' multithreaded PyArrow engine
+        when PyArrow is available.
+
+        Without reader arguments, CSV columns holding only ISO 8601 dates or
+        datetimes become datetime64[us] whichever reader loaded the file.
+
         Args:
             file_path: Path to dataset file
-            sample_size: Optional sample size for large datasets
+            sample_size: Optional sample size (rows). Files over LARGE_DATASET_MB
+                are sampled even without one, to data_science.chunk_size_rows rows
+            columns: Optional subset of columns to load
             **kwargs: Additional arguments for pandas readers
 
         Returns:
@@ -84,39 +131,29 @@ class EDA:
         file_path = Path(file_path)
         suffix = file_path.suffix.lower()
 
-        # Determine if we should sample
+        # Determine if we should sample; bool is an int subclass but not a row count
         size_mb = file_path.stat().st_size / (1024 * 1024)
-        use_sample = sample_size or (size_mb > 500)  # Sample if > 500MB
+        sample_rows = None
+        if isinstance(sample_size, int) and not isinstance(sample_size, bool) and sample_size > 0:
+            sample_rows = sample_size
+        elif size_mb > LARGE_DATASET_MB:
+            sample_rows = int(Config().get('data_science.chunk_size_rows', 10000))
 
         try:
-            if suffix == '.csv':
-                if use_sample and isinstance(use_sample, int):
-                    df = pd.read_csv(file_path, nrows=use_sample, **kwargs)
-                else:
-                    df = pd.read_csv(file_path, **kwargs)
-
-            elif suffix == '.parquet':
-                df = pd.read_parquet(file_path, **kwargs)
-                if use_sample and isinstance(use_sample, int):
-                    df = df.sample(n=min(use_sample, len(df)), random_state=42)
-
-            elif suffix in ['.xlsx', '.xls']:
-                df = pd.read_excel(file_path, **kwargs)
-                if use_sample and isinstance(use_sample, int):
-                    df = df.sample(n=min(use_sample, len(df)), random_state=42)
-
-            elif suffix == '.json':
-                df = pd.read_json(file_path, **kwargs)
-                if use_sample and isinstance(use_sample, int):
-                    df = df.sample(n=min(use_sample, len(df)), random_state=42)
-
-            elif suffix == '.feather':
-                df = pd.read_feather(file_path, **kwargs)
-                if use_sample and isinstance(use_sample, int):
-                    df = df.sample(n=min(use_sample, len(df)), random_state=42)
-
+            if HAS_POLARS and not kwargs and suffix in ('.csv', '.parquet', '.feather'):
+                try:
+                    df = self._load_with_polars(file_path, suffix, sample_rows, columns)
+                except pl.exceptions.ComputeError:
+                    # Polars could not parse the file with its inferred schema
+                    df = self._load_with_pandas(file_path, suffix, sample_rows, columns)
             else:
-                raise ValueError(f"Unsupported file format: {suffix}")
+                df = self._load_with_pandas(file_path, suffix, sample_rows, columns, **kwargs)
+
+            if suffix == '.csv' and not kwargs:
+                df = self._parse_datetime_columns(df)
+
+            if columns is not None and suffix not in ('.csv', '.parquet'):
+                df = df[columns]
 
             # Cache the dataset
             self.datasets[file_path.stem] = df
@@ -126,17 +163,159 @@ class EDA:
         except Exception as e:
             raise RuntimeError(f"Failed to load {file_path}: {str(e)}")
 
-    def profile_dataset(self, df: pd.DataFrame, name: str = "dataset") -> Dict[str, Any]:
+    def _load_with_pandas(
+        self,
+        file_path: Path,
+        suffix: str,
+        sample_rows: Optional[int],
+        columns: Optional[List[str]] = None,
+        **kwargs
+    ) -> pd.DataFrame:
+        """Load a dataset with the pandas reader for its format"""
+        if suffix == '.csv':
+            if sample_rows:
+                df = pd.read_csv(file_path, nrows=sample_rows, usecols=columns, **kwargs)
+            elif HAS_PYARROW and not kwargs:
+                # The PyArrow engine parses in parallel but does not support nrows
+                df = pd.read_csv(file_path, usecols=columns, engine='pyarrow')
+            else:
+                df = pd.read_csv(file_path, usecols=columns, **kwargs)
+
+        elif suffix == '.parquet':
+            df = pd.read_parquet(file_path, columns=columns, **kwargs)
+            if sample_rows:
+                df = df.sample(n=min(sample_rows, len(df)), random_state=42)
+
+        elif suffix in ['.xlsx', '.xls']:
+            df = pd.read_excel(file_path, **kwargs)
+            if sample_rows:
+                df = df.sample(n=min(sample_rows, len(df)), random_state=42)
+
+        elif suffix == '.json':
+            df = pd.read_json(file_path, **kwargs)
+            if sample_rows:
+                df = df.sample(n=min(sample_rows, len(df)), random_state=42)
+
+        elif suffix == '.feather':
+            df = pd.read_feather(file_path, **kwargs)
+            if sample_rows:
+                df = df.sample(n=min(sample_rows, len(df)), random_state=42)
+
+        else:
+            raise ValueError(f"Unsupported file format: {suffix}")
+
+        return df
+
+    def _load_with_polars(
+        self,
+        file_path: Path,
+        suffix: str,
+        sample_rows: Optional[int],
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """Load CSV/Parquet/Feather through a Polars lazy scan with projection pushdown"""
+        if suffix == '.csv':
+            # Infer the schema from every row (not just the first 100) and treat the
+            # same strings as missing as pandas does
+            lf = pl.scan_csv(file_path, infer_schema_length=None, null_values=PANDAS_NA_VALUES)
+        elif suffix == '.parquet':
+            lf = pl.scan_parquet(file_path)
+        else:
+            lf = pl.scan_ipc(file_path)
+
+        if columns is not None:
+            lf = lf.select(columns)
+
+        if sample_rows:
+            if suffix == '.csv':
+                # CSV samples are the leading rows (like nrows)
+                lf = lf.head(sample_rows)
+            else:
+                # Row count comes from file metadata; take evenly spaced rows
+                # rather than reading everything to draw a random sample
+                n_rows = lf.select(pl.len()).collect().item()
+                lf = lf.gather_every(max(1, n_rows // sample_rows)).head(sample_rows)
+
+        return self._collect_streaming(lf).to_pandas()
+
+    @staticmethod
+    def _collect_streaming(lf: Any) -> Any:
+        """Collect a LazyFrame with the streaming engine (bounded memory)"""
+        try:
+            return lf.collect(engine='streaming')
+        except TypeError:
+            # Polars releases before the engine= argument
+            return lf.collect(streaming=True)
+
+    @staticmethod
+    def _parse_datetime_columns(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert ISO 8601 date/datetime columns to datetime64[us]
+
+        Readers disagree here: PyArrow infers dates and timestamps itself
+        (at second resolution), while the pandas C engine and Polars keep the
+        text. Normalising after every CSV load keeps dtypes independent of
+        which optional readers are installed.
+        """
+        for col in df.columns:
+            series = df[col]
+
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                df[col] = series.dt.as_unit('us')
+                continue
+
+            if not (series.dtype == object or pd.api.types.is_string_dtype(series.dtype)):
+                continue
+
+            values = series.dropna()
+            if values.empty:
+                continue
+
+            first = values.iloc[0]
+            if isinstance(first, datetime.date):
+                # datetime.date objects from PyArrow's date inference
+                converted = pd.to_datetime(series)
+            elif isinstance(first, str) and _ISO_DATETIME_RE.fullmatch(first):
+                values = values.astype(str)
+                if not values.str.fullmatch(_ISO_DATETIME_PATTERN).all():
+                    continue
+
+                # Like PyArrow: offsets are converted to UTC, and a mix of naive and
+                # zoned values stays text
+                has_tz = values.str.contains(_ISO_TIMEZONE_PATTERN)
+                if has_tz.any() and not has_tz.all():
+                    continue
+                try:
+                    converted = pd.to_datetime(series, format='ISO8601', utc=bool(has_tz.all()))
+                except (ValueError, TypeError):
+                    continue
+            else:
+                continue
+
+            df[col] = converted.dt.as_unit('us')
+
+        return df
+
+    def profile_dataset(
+        self,
+        df: pd.DataFrame,
+        name: str = "dataset",
+        n_jobs: int = -1
+    ) -> Dict[str, Any]:
         """
         Create comprehensive profile of a dataset
 
         Args:
             df: DataFrame to profile
             name: Name for the dataset
+            n_jobs: Number of threads used to profile columns (-1 for all cores)
 
         Returns:
             Dictionary with profile information
         """
+        # Row hashing is the priciest frame-wide pass; do it once
+        dup_count = int(df.duplicated().sum())
+
         profile = {
             'name': name,
             'shape': df.shape,
@@ -145,68 +324,190 @@ class EDA:
             'columns': {},
             'missing_values': {},
             'duplicates': {
-                'count': df.duplicated().sum(),
-                'percentage': (df.duplicated().sum() / len(df)) * 100
+                'count': dup_count,
+                'percentage': (dup_count / len(df)) * 100
             }
         }
 
-        # Profile each column
-        for col in df.columns:
-            col_profile = self._profile_column(df[col])
-            profile['columns'][col] = col_profile
-
-            # Track missing values
-            missing_count = df[col].isna().sum()
-            if missing_count > 0:
-                profile['missing_values'][col] = {
-                    'count': int(missing_count),
-                    'percentage': round((missing_count / len(df)) * 100, 2)
-                }
+        # Frame-wide counts in one pass instead of once per column
+        missing = df.isna().sum()
+        # Object/categorical unique counts come from their value counts instead
+        n_unique = df.select_dtypes(exclude=['object', 'category']).nunique()
+
+        # All numeric summary statistics in a single describe() pass,
+        # over narrowed integer columns to cut the bytes scanned
+        numeric_df = self._downcast(df.select_dtypes(include=[np.number]))
+        numeric_stats = (
+            numeric_df.describe(percentiles=[.25, .5, .75]).to_dict()
+            if len(numeric_df.columns) else {}
+        )
+
+        # Classify each distinct dtype once rather than introspecting every column
+        kinds = {dtype: self._column_kind(dtype) for dtype in set(df.dtypes)}
+
+        # Profile each column; columns are independent and the pandas/NumPy
+        # reductions release the GIL, so threads run them concurrently
+        col_profiles = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(self._profile_column)(
+                df[col], missing[col], n_unique.get(col), numeric_stats.get(col),
+                kinds[dtype]
+            )
+            for col, dtype in df.dtypes.items()
+        )
+
+        profile['columns'] = dict(zip(df.columns, col_profiles))
+
+        # Track missing values, with percentages computed for all affected columns at once
+        missing = missing[missing > 0]
+        missing_pct = (missing / len(df) * 100).round(2)
+        profile['missing_values'] = {
+            col: {'count': int(count), 'percentage': float(pct)}
+            for col, count, pct in zip(missing.index, missing.to_numpy(), missing_pct.to_numpy())
+        }
 
         # Cache profile
         self.profiles[name] = profile
 
         return profile
 
-    def _profile_column(self, series: pd.Series) -> Dict[str, Any]:
-        """Profile a single column"""
+    def _profile_column(
+        self,
+        series: pd.Series,
+        missing: Optional[int] = None,
+        n_unique: Optional[int] = None,
+        stats: Optional[Dict[str, float]] = None,
+        kind: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Profile a single column
+
+        missing/n_unique counts, the column kind (see _column_kind) and, for
+        numeric columns, the describe() statistics may be precomputed by
+        profile_dataset().
+        """
+        missing = int(series.isna().sum() if missing is None else missing)
+        if kind is None:
+            kind = self._column_kind(series.dtype)
+
+        # Object/categorical columns are counted once; nunique falls out of the counts
+        if kind == 'categorical':
+            labels, counts = self._category_counts(series)
+            if n_unique is None:
+                n_unique = np.count_nonzero(counts)
+
+        n_unique = int(series.nunique() if n_unique is None else n_unique)
+
         profile = {
             'dtype': str(series.dtype),
-            'missing': int(series.isna().sum()),
-            'unique': int(series.nunique()),
-            'unique_percentage': round((series.nunique() / len(series)) * 100, 2)
+            'missing': missing,
+            'unique': n_unique,
+            'unique_percentage': round((n_unique / len(series)) * 100, 2)
         }
 
-        # Numeric columns
-        if pd.api.types.is_numeric_dtype(series):
-            profile.update({
-                'mean': float(series.mean()) if not series.isna().all() else None,
-                'std': float(series.std()) if not series.isna().all() else None,
-                'min': float(series.min()) if not series.isna().all() else None,
-                'max': float(series.max()) if not series.isna().all() else None,
-                'median': float(series.median()) if not series.isna().all() else None,
-                'q25': float(series.quantile(0.25)) if not series.isna().all() else None,
-                'q75': float(series.quantile(0.75)) if not series.isna().all() else None,
-            })
-
-        # Categorical/Object columns
-        elif pd.api.types.is_object_dtype(series) or pd.api.types.is_categorical_dtype(series):
-            value_counts = series.value_counts()
-            profile.update({
-                'most_common': value_counts.head(5).to_dict(),
-                'cardinality': 'high' if series.nunique() > 50 else 'medium' if series.nunique() > 10 else 'low'
-            })
-
-        # Datetime columns
-        elif pd.api.types.is_datetime64_any_dtype(series):
-            profile.update({
-                'min_date': str(series.min()),
-                'max_date': str(series.max()),
-                'range_days': (series.max() - series.min()).days if not series.isna().all() else None
-            })
+        if kind == 'numeric':
+            profile.update(self._numeric_summary(series, stats))
+        elif kind == 'categorical':
+            profile.update(self._categorical_summary(labels, counts, n_unique))
+        elif kind == 'datetime':
+            profile.update(self._datetime_summary(series))
 
         return profile
 
+    @staticmethod
+    def _column_kind(dtype: Any) -> str:
+        """Classify a dtype as 'numeric', 'categorical', 'datetime' or 'other'"""
+        if pd.api.types.is_numeric_dtype(dtype):
+            return 'numeric'
+        if pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            return 'categorical'
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            return 'datetime'
+        return 'other'
+
+    @staticmethod
+    def _numeric_summary(
+        series: pd.Series,
+        stats: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """Summary statistics for a numeric column, from describe() output if given"""
+        if stats is not None:
+            has_values = stats['count'] > 0
+            return {
+                'mean': float(stats['mean']) if has_values else None,
+                'std': float(stats['std']) if has_values else None,
+                'min': float(stats['min']) if has_values else None,
+                'max': float(stats['max']) if has_values else None,
+                'median': float(stats['50%']) if has_values else None,
+                'q25': float(stats['25%']) if has_values else None,
+                'q75': float(stats['75%']) if has_values else None,
+            }
+
+        return {
+            'mean': float(series.mean()) if not series.isna().all() else None,
+            'std': float(series.std()) if not series.isna().all() else None,
+            'min': float(series.min()) if not series.isna().all() else None,
+            'max': float(series.max()) if not series.isna().all() else None,
+            'median': float(series.median()) if not series.isna().all() else None,
+            'q25': float(series.quantile(0.25)) if not series.isna().all() else None,
+            'q75': float(series.quantile(0.75)) if not series.isna().all() else None,
+        }
+
+    @staticmethod
+    def _categorical_summary(labels: Any, counts: np.ndarray, n_unique: int) -> Dict[str, Any]:
+        """Top values and cardinality for an object/categorical column"""
+        top = np.arange(len(counts))
+        if len(top) > 5:
+            # Partial selection: keep only values tied with or above the 5th largest count
+            fifth = np.partition(counts, len(counts) - 5)[len(counts) - 5]
+            top = np.flatnonzero(counts >= fifth)
+        # Stable sort keeps first-seen order among ties, like value_counts()
+        top = top[np.argsort(-counts[top], kind='stable')[:5]]
+        return {
+            'most_common': {labels[i]: int(counts[i]) for i in top},
+            'cardinality': 'high' if n_unique > 50 else 'medium' if n_unique > 10 else 'low'
+        }
+
+    @staticmethod
+    def _datetime_summary(series: pd.Series) -> Dict[str, Any]:
+        """Date range of a datetime column"""
+        return {
+            'min_date': str(series.min()),
+            'max_date': str(series.max()),
+            'range_days': (series.max() - series.min()).days if not series.isna().all() else None
+        }
+
+    @staticmethod
+    def _downcast(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Narrow integer columns to the smallest dtype that holds their range
+
+        Lossless for profiling: pandas accumulates integer statistics in
+        float64 whatever the input width. Float columns are left as float64
+        because float32 accumulation would shift mean/std. The input frame
+        is not modified.
+        """
+        int_cols = df.select_dtypes(include=[np.integer]).columns
+        if not len(int_cols):
+            return df
+
+        narrowed = df.copy(deep=False)
+        for col in int_cols:
+            narrowed[col] = pd.to_numeric(narrowed[col], downcast='integer')
+
+        return narrowed
+
+    @staticmethod
+    def _category_counts(series: pd.Series) -> Tuple[Any, np.ndarray]:
+        """Count occurrences per distinct value with one factorize + bincount pass"""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes = series.cat.codes.to_numpy()
+            labels = series.cat.categories
+        else:
+            codes, labels = pd.factorize(series)  # missing values get code -1
+
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+        return labels, counts
+
     def analyze_correlations(
         self,
         df: pd.DataFrame,
@@ -230,19 +531,23 @@ class EDA:
             return {'error': 'Not enough numeric columns for correlation analysis'}
 
         # Compute correlation matrix
-        corr_matrix = df[numeric_cols].corr(method=method)
-
-        # Find high correlations
-        high_corr = []
-        for i in range(len(corr_matrix.columns)):
-            for j in range(i + 1, len(corr_matrix.columns)):
-                corr_value = corr_matrix.iloc[i, j]
-                if abs(corr_value) >= threshold:
-                    high_corr.append({
-                        'feature_1': corr_matrix.columns[i],
-                        'feature_2': corr_matrix.columns[j],
-                        'correlation': round(corr_value, 3)
-                    })
+        corr_matrix = self._correlation_matrix(df[numeric_cols], method)
+
+        # Find high correlations in the upper triangle (NaN never passes the mask)
+        corr_values = corr_matrix.to_numpy()
+        rows, cols = np.triu_indices(corr_values.shape[0], k=1)
+        pair_values = corr_values[rows, cols]
+        mask = np.abs(pair_values) >= threshold
+
+        columns = corr_matrix.columns
+        high_corr = [
+            {
+                'feature_1': columns[i],
+                'feature_2': columns[j],
+                'correlation': round(value, 3)
+            }
+            for i, j, value in zip(rows[mask], cols[mask], pair_values[mask])
+        ]
 
         return {
             'correlation_matrix': corr_matrix.to_dict(),
@@ -251,6 +556,36 @@ class EDA:
             'method': method
         }
 
+    def _correlation_matrix(self, numeric_df: pd.DataFrame, method: str) -> pd.DataFrame:
+        """
+        Correlation matrix via a single np.corrcoef call where possible
+
+        Pearson and Spearman on complete data reduce to np.corrcoef on the
+        values (or average ranks). Missing values need pandas' pairwise
+        deletion, and Kendall has no corrcoef form; both use DataFrame.corr.
+        With missing values Spearman ranks each pair only after dropping that
+        pair's NaNs, so the unranked frame goes to pandas.
+        """
+        if method not in ('pearson', 'spearman'):
+            return numeric_df.corr(method=method)
+
+        arr = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(arr).any():
+            return numeric_df.corr(method=method)
+
+        if method == 'spearman':
+            numeric_df = numeric_df.rank()
+            arr = numeric_df.to_numpy(dtype=np.float64)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = np.corrcoef(arr, rowvar=False)
+
+        # Match pandas: exact 1.0 on the diagonal for non-constant columns
+        diag = np.diag_indices_from(corr)
+        corr[diag] = np.where(np.isnan(corr[diag]), np.nan, 1.0)
+
+        return pd.DataFrame(corr, index=numeric_df.columns, columns=numeric_df.columns)
+
     def detect_outliers(
         self,
         df: pd.DataFrame,
@@ -268,37 +603,47 @@ class EDA:
         Returns:
             Dictionary with outlier information
         """
+        if method not in ('iqr', 'zscore'):
+            raise ValueError(f"Unknown method: {method}")
+
         numeric_cols = df.select_dtypes(include=[np.number]).columns
         outliers = {}
 
-        for col in numeric_cols:
-            series = df[col].dropna()
+        if not len(numeric_cols) or not len(df):
+            return {
+                'method': method,
+                'threshold': threshold,
+                'outliers_by_column': outliers
+            }
+
+        # All numeric columns as one 2D array; NaNs are ignored per column
+        arr = df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid_counts = (~np.isnan(arr)).sum(axis=0)
 
-            if len(series) == 0:
-                continue
+        with warnings.catch_warnings(), np.errstate(divide='ignore', invalid='ignore'):
+            warnings.simplefilter('ignore', RuntimeWarning)
 
             if method == 'iqr':
-                q1 = series.quantile(0.25)
-                q3 = series.quantile(0.75)
+                q1, q3 = np.nanpercentile(arr, [25, 75], axis=0)
                 iqr = q3 - q1
                 lower_bound = q1 - threshold * iqr
                 upper_bound = q3 + threshold * iqr
 
-                outlier_mask = (series < lower_bound) | (series > upper_bound)
-                outlier_count = outlier_mask.sum()
+                outlier_mask = (arr < lower_bound) | (arr > upper_bound)
 
-            elif method == 'zscore':
-                z_scores = np.abs((series - series.mean()) / series.std())
+            else:
+                z_scores = np.abs(
+                    (arr - np.nanmean(arr, axis=0)) / np.nanstd(arr, axis=0, ddof=1)
+                )
                 outlier_mask = z_scores > threshold
-                outlier_count = outlier_mask.sum()
 
-            else:
-                raise ValueError(f"Unknown method: {method}")
+        outlier_counts = outlier_mask.sum(axis=0)
 
-            if outlier_count > 0:
+        for col, outlier_count, n_valid in zip(numeric_cols, outlier_counts, valid_counts):
+            if n_valid > 0 and outlier_count > 0:
                 outliers[col] = {
                     'count': int(outlier_count),
-                    'percentage': round((outlier_count / len(series)) * 100, 2)
+                    'percentage': round((outlier_count / n_valid) * 100, 2)
                 }
 
         return {
@@ -398,72 +743,70 @@ class EDA:
             report: EDA report dictionary
             output_path: Path to save markdown file
         """
-        lines = []
+        buf = io.StringIO()
+        write = buf.write
 
-        lines.append(f"# EDA Report: {report['dataset_name']}")
-        lines.append("")
-        lines.append(f"**Generated**: {pd.Timestamp.now()}")
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+        write(f"# EDA Report: {report['dataset_name']}\n\n")
+        write(f"**Generated**: {pd.Timestamp.now()}\n\n")
+        write("---\n\n")
 
         # Dataset Overview
         profile = report['profile']
-        lines.append("## Dataset Overview")
-        lines.append("")
-        lines.append(f"- **Rows**: {profile['shape'][0]:,}")
-        lines.append(f"- **Columns**: {profile['shape'][1]}")
-        lines.append(f"- **Memory**: {profile['memory_usage_mb']:.2f} MB")
-        lines.append(f"- **Duplicates**: {profile['duplicates']['count']} ({profile['duplicates']['percentage']:.2f}%)")
-        lines.append("")
+        write("## Dataset Overview\n\n")
+        write(f"- **Rows**: {profile['shape'][0]:,}\n")
+        write(f"- **Columns**: {profile['shape'][1]}\n")
+        write(f"- **Memory**: {profile['memory_usage_mb']:.2f} MB\n")
+        write(f"- **Duplicates**: {profile['duplicates']['count']} ({profile['duplicates']['percentage']:.2f}%)\n\n")
 
         # Missing Values
         if profile.get('missing_values'):
-            lines.append("## Missing Values")
-            lines.append("")
-            lines.append("| Column | Missing Count | Percentage |")
-            lines.append("|--------|---------------|------------|")
-            for col, info in sorted(
-                profile['missing_values'].items(),
-                key=lambda x: x[1]['count'],
-                reverse=True
-            ):
-                lines.append(f"| {col} | {info['count']} | {info['percentage']:.2f}% |")
-            lines.append("")
+            write("## Missing Values\n\n")
+            write("| Column | Missing Count | Percentage |\n")
+            write("|--------|---------------|------------|\n")
+            buf.writelines(
+                f"| {col} | {info['count']} | {info['percentage']:.2f}% |\n"
+                for col, info in sorted(
+                    profile['missing_values'].items(),
+                    key=lambda x: x[1]['count'],
+                    reverse=True
+                )
+            )
+            write("\n")
 
         # High Correlations
         if report['correlations'].get('high_correlations'):
-            lines.append("## High Correlations")
-            lines.append("")
-            for corr in report['correlations']['high_correlations']:
-                lines.append(
-                    f"- **{corr['feature_1']}** ↔ **{corr['feature_2']}**: "
-                    f"{corr['correlation']:.3f}"
-                )
-            lines.append("")
+            write("## High Correlations\n\n")
+            buf.writelines(
+                f"- **{corr['feature_1']}** ↔ **{corr['feature_2']}**: "
+                f"{corr['correlation']:.3f}\n"
+                for corr in report['correlations']['high_correlations']
+            )
+            write("\n")
 
         # Outliers
         if report['outliers'].get('outliers_by_column'):
-            lines.append("## Outliers")
-            lines.append("")
-            lines.append("| Column | Outlier Count | Percentage |")
-            lines.append("|--------|---------------|------------|")
-            for col, info in report['outliers']['outliers_by_column'].items():
-                lines.append(f"| {col} | {info['count']} | {info['percentage']:.2f}% |")
-            lines.append("")
+            write("## Outliers\n\n")
+            write("| Column | Outlier Count | Percentage |\n")
+            write("|--------|---------------|------------|\n")
+            buf.writelines(
+                f"| {col} | {info['count']} | {info['percentage']:.2f}% |\n"
+                for col, info in report['outliers']['outliers_by_column'].items()
+            )
+            write("\n")
 
         # Preprocessing Suggestions
         if report['suggestions']:
-            lines.append("## Preprocessing Suggestions")
-            lines.append("")
-            for i, suggestion in enumerate(report['suggestions'], 1):
-                lines.append(f"{i}. {suggestion}")
-            lines.append("")
+            write("## Preprocessing Suggestions\n\n")
+            buf.writelines(
+                f"{i}. {suggestion}\n"
+                for i, suggestion in enumerate(report['suggestions'], 1)
+            )
+            write("\n")
 
-        # Write file
+        # Write file (every section ends with a blank line; the file keeps a single trailing newline)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w') as f:
-            f.write('\n'.join(lines))
+            f.write(buf.getvalue()[:-1])
 
     def __repr__(self) -> str:
         return f"EDA(data_dir={self.data_dir}, datasets={len(self.datasets)})"
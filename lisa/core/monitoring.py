@@ -5,9 +5,21 @@ Monitors training progress, detects issues (overfitting, convergence, anomalies)
 and provides alerts and recommendations.
 """
 
+import copy
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
-from collections import deque
+
+# matplotlib is optional and slow to import; load pyplot on the first plot only
+_plt = None
+
+
+def _get_plt():
+    """Import matplotlib.pyplot once and reuse it for later plots"""
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
 
 
 class TrainingMonitor:
@@ -50,8 +62,25 @@ class TrainingMonitor:
         self.overfitting_detected = False
         self.anomaly_detected = False
 
-        # Recent metrics for convergence check
-        self.recent_metrics = deque(maxlen=convergence_window)
+        # get_status() result for the current history and thresholds;
+        # _history_version is bumped on every log_epoch()
+        self._history_version = 0
+        self._status_cache = None
+
+        # Anomaly flags from the last check_anomalies() scan, and which lists it
+        # covered up to where; only entries appended since then are rescanned
+        self._scanned_train = None
+        self._scanned_val = None
+        self._scanned_len = 0
+        self._scanned_val_len = 0
+        self._train_flags = (False, False, None)  # (nan, inf, exploding value)
+        self._val_flags = (False, False)  # (nan, inf)
+
+        # Sliding window of the last convergence_window val metrics, with a
+        # running (Welford) mean and sum of squared deviations (and the peak of
+        # the latter since it was last rebuilt); _window_source holds the list
+        # and length it was fed from, so edits to val_metrics trigger a rebuild
+        self._rebuild_window()
 
     def log_epoch(
         self,
@@ -71,6 +100,8 @@ class TrainingMonitor:
             learning_rate: Current learning rate (optional)
             verbose: Print epoch metrics to console
         """
+        self._history_version += 1
+
         self.epochs.append(epoch)
         self.train_metrics.append(train_metric)
 
@@ -78,7 +109,7 @@ class TrainingMonitor:
 
         if val_metric is not None:
             self.val_metrics.append(val_metric)
-            self.recent_metrics.append(val_metric)
+            self._update_window(val_metric)
 
             # Check if this is best validation metric
             if self.best_val_metric is None or val_metric > self.best_val_metric:
@@ -100,6 +131,71 @@ class TrainingMonitor:
             else:
                 print(f"Epoch {epoch:3d} | Train: {train_metric:.4f}")
 
+    def _window_in_sync(self) -> bool:
+        """Whether the window still covers the tail of val_metrics at the current size"""
+        source, fed = self._window_source
+        return (
+            source is self.val_metrics
+            and fed == len(self.val_metrics)
+            and len(self._window) == max(self.convergence_window, 0)
+        )
+
+    def _rebuild_window(self):
+        """Refill the convergence window from the tail of val_metrics"""
+        size = max(self.convergence_window, 0)
+        recent = np.asarray(self.val_metrics[-size:] if size else [], dtype=np.float64)
+
+        self._window = np.empty(size, dtype=np.float64)
+        self._window[:len(recent)] = recent
+        self._window_len = len(recent)
+        self._window_pos = len(recent) % size if size else 0
+        self._window_mean = float(np.mean(recent)) if len(recent) else 0.0
+        self._window_m2 = float(np.sum((recent - self._window_mean) ** 2))
+        self._window_m2_peak = self._window_m2
+        self._window_source = (self.val_metrics, len(self.val_metrics))
+
+    def _update_window(self, value: float):
+        """Push the val metric just appended into the convergence window in O(1)"""
+        source, fed = self._window_source
+        self._window_source = (source, fed + 1)
+        if not self._window_in_sync():
+            # val_metrics or convergence_window was changed since the last update
+            self._rebuild_window()
+            return
+
+        size = len(self._window)
+        if size == 0:
+            return
+
+        value = float(value)
+        pos = self._window_pos
+
+        if self._window_len < size:
+            # Window still filling: standard Welford update
+            self._window[pos] = value
+            self._window_len += 1
+            delta = value - self._window_mean
+            self._window_mean += delta / self._window_len
+            self._window_m2 += delta * (value - self._window_mean)
+        else:
+            # Window full: replace the oldest value
+            old = self._window[pos]
+            self._window[pos] = value
+            old_mean = self._window_mean
+            self._window_mean += (value - old) / size
+            self._window_m2 += (value - old) * (value - self._window_mean + old - old_mean)
+
+        self._window_pos = (pos + 1) % size
+        self._window_m2_peak = max(self._window_m2_peak, self._window_m2)
+
+        # NaN/Inf would poison the running sums for good, and replacing large values
+        # with small ones can cancel M2 down to rounding noise; rebuild from the buffer
+        if not np.isfinite(self._window_m2) or self._window_m2 < 1e-6 * self._window_m2_peak:
+            filled = self._window[:self._window_len]
+            self._window_mean = float(np.mean(filled))
+            self._window_m2 = float(np.sum((filled - self._window_mean) ** 2))
+            self._window_m2_peak = self._window_m2
+
     def check_convergence(self) -> Tuple[bool, str]:
         """
         Check if training has converged
@@ -107,11 +203,14 @@ class TrainingMonitor:
         Returns:
             Tuple of (converged: bool, reasoning: str)
         """
-        if len(self.recent_metrics) < self.convergence_window:
+        if not self._window_in_sync():
+            self._rebuild_window()
+
+        if self._window_len == 0 or self._window_len < self.convergence_window:
             return False, "Not enough data for convergence check"
 
-        # Calculate variance in recent metrics
-        variance = np.var(list(self.recent_metrics))
+        # Population variance of the recent metrics (same as np.var)
+        variance = max(self._window_m2, 0.0) / self._window_len
 
         if variance < self.convergence_threshold:
             self.converged = True
@@ -150,18 +249,45 @@ class TrainingMonitor:
         """
         issues = []
 
+        # Scan only what was appended since the previous call, in one isfinite
+        # pass; a list that was replaced or shortened in between is rescanned
+        train_metrics, val_metrics = self.train_metrics, self.val_metrics
+        if train_metrics is not self._scanned_train or len(train_metrics) < self._scanned_len:
+            self._scanned_train, self._scanned_len = train_metrics, 0
+            self._train_flags = (False, False, None)
+
+        if val_metrics is not self._scanned_val or len(val_metrics) < self._scanned_val_len:
+            self._scanned_val, self._scanned_val_len = val_metrics, 0
+            self._val_flags = (False, False)
+
+        if len(train_metrics) > self._scanned_len:
+            train = np.asarray(train_metrics[self._scanned_len:], dtype=np.float64)
+            nan, inf = self._non_finite(train)
+            big = np.abs(train) > 1e6
+            exploding = float(train[big][-1]) if big.any() else None
+            self._train_flags = (nan, inf, exploding)
+            self._scanned_len = len(train_metrics)
+
+        if len(val_metrics) > self._scanned_val_len:
+            val = np.asarray(val_metrics[self._scanned_val_len:], dtype=np.float64)
+            self._val_flags = self._non_finite(val)
+            self._scanned_val_len = len(val_metrics)
+
+        train_nan, train_inf, exploding = self._train_flags
+        val_nan, val_inf = self._val_flags
+
         # Check for NaN in recent metrics
-        if self.train_metrics and np.isnan(self.train_metrics[-1]):
+        if train_nan:
             issues.append("NaN detected in training metric")
 
-        if self.val_metrics and np.isnan(self.val_metrics[-1]):
+        if val_nan:
             issues.append("NaN detected in validation metric")
 
         # Check for infinite values
-        if self.train_metrics and np.isinf(self.train_metrics[-1]):
+        if train_inf:
             issues.append("Inf detected in training metric")
 
-        if self.val_metrics and np.isinf(self.val_metrics[-1]):
+        if val_inf:
             issues.append("Inf detected in validation metric")
 
         # Check for sudden drops (metric degradation)
@@ -171,28 +297,45 @@ class TrainingMonitor:
                 issues.append(f"Sudden metric change: {recent_change:.4f}")
 
         # Check for exploding metrics
-        if self.train_metrics and abs(self.train_metrics[-1]) > 1e6:
-            issues.append(f"Exploding training metric: {self.train_metrics[-1]:.2e}")
+        if exploding is not None:
+            issues.append(f"Exploding training metric: {exploding:.2e}")
 
         if issues:
             self.anomaly_detected = True
 
         return len(issues) > 0, issues
 
-    def should_stop(self) -> Tuple[bool, str]:
+    @staticmethod
+    def _non_finite(values: np.ndarray) -> Tuple[bool, bool]:
+        """Return (has_nan, has_inf) for a slice of metrics"""
+        finite = np.isfinite(values)
+        if finite.all():
+            return False, False
+        bad = values[~finite]
+        return bool(np.isnan(bad).any()), bool(np.isinf(bad).any())
+
+    def should_stop(
+        self,
+        anomalies: Optional[Tuple[bool, List[str]]] = None,
+        convergence: Optional[Tuple[bool, str]] = None
+    ) -> Tuple[bool, str]:
         """
         Determine if training should stop
 
+        Args:
+            anomalies: Result of check_anomalies() if already computed
+            convergence: Result of check_convergence() if already computed
+
         Returns:
             Tuple of (should_stop: bool, reasoning: str)
         """
         # Check for anomalies first
-        has_anomaly, issues = self.check_anomalies()
+        has_anomaly, issues = anomalies if anomalies is not None else self.check_anomalies()
         if has_anomaly:
             return True, f"Anomalies detected: {', '.join(issues)}"
 
         # Check for convergence
-        converged, conv_reason = self.check_convergence()
+        converged, conv_reason = convergence if convergence is not None else self.check_convergence()
         if converged:
             return True, conv_reason
 
@@ -209,10 +352,28 @@ class TrainingMonitor:
         Returns:
             Dictionary with monitoring status
         """
-        converged, conv_reason = self.check_convergence()
+        # Repeated queries between epochs reuse the previous result, unless a
+        # threshold or one of the history lists was changed in the meantime
+        cache_key = (
+            self._history_version,
+            id(self.train_metrics), len(self.train_metrics),
+            id(self.val_metrics), len(self.val_metrics),
+            id(self.learning_rates), len(self.learning_rates),
+            self.patience,
+            self.overfitting_threshold,
+            self.convergence_threshold,
+            self.convergence_window,
+        )
+        cached = self._status_cache
+        if cached is not None and cached[0] == cache_key:
+            return copy.deepcopy(cached[1])
+
+        convergence = self.check_convergence()
+        converged, conv_reason = convergence
         overfitting, overfit_reason = self.check_overfitting()
-        has_anomaly, anomaly_issues = self.check_anomalies()
-        should_stop, stop_reason = self.should_stop()
+        anomalies = self.check_anomalies()
+        has_anomaly, anomaly_issues = anomalies
+        should_stop, stop_reason = self.should_stop(anomalies, convergence)
 
         status = {
             'total_epochs': len(self.epochs),
@@ -238,7 +399,8 @@ class TrainingMonitor:
         if self.learning_rates:
             status['latest_learning_rate'] = self.learning_rates[-1]
 
-        return status
+        self._status_cache = (cache_key, status)
+        return copy.deepcopy(status)
 
     def get_recommendations(self) -> List[str]:
         """
@@ -276,7 +438,7 @@ class TrainingMonitor:
                 recommendations.append("Significantly reduce learning rate")
 
         # Check learning rate (if available)
-        if self.learning_rates and len(self.learning_rates) >= 2:
+        if len(self.learning_rates) >= 2:
             if self.learning_rates[-1] == self.learning_rates[-2]:
                 if self.epochs_since_improvement > 5:
                     recommendations.append("Consider using learning rate scheduler")
@@ -332,15 +494,16 @@ class TrainingMonitor:
             matplotlib figure
         """
         try:
-            import matplotlib.pyplot as plt
+            plt = _get_plt()
 
             fig, axes = plt.subplots(1, 2, figsize=(14, 5))
 
             # Plot metrics
             ax1 = axes[0]
-            ax1.plot(self.epochs, self.train_metrics, 'b-', label='Train', linewidth=2)
+            epochs = self.epochs
+            ax1.plot(epochs, self.train_metrics, 'b-', label='Train', linewidth=2)
             if self.val_metrics:
-                ax1.plot(self.epochs, self.val_metrics, 'r-', label='Validation', linewidth=2)
+                ax1.plot(epochs[:len(self.val_metrics)], self.val_metrics, 'r-', label='Validation', linewidth=2)
 
             # Mark best epoch
             if self.best_epoch and self.best_val_metric:
@@ -355,7 +518,7 @@ class TrainingMonitor:
             # Plot learning rate if available
             ax2 = axes[1]
             if self.learning_rates:
-                ax2.plot(self.epochs[:len(self.learning_rates)], self.learning_rates, 'g-', linewidth=2)
+                ax2.plot(epochs[:len(self.learning_rates)], self.learning_rates, 'g-', linewidth=2)
                 ax2.set_xlabel('Epoch')
                 ax2.set_ylabel('Learning Rate')
                 ax2.set_title('Learning Rate Schedule')
@@ -382,13 +545,21 @@ class TrainingMonitor:
         self.train_metrics = []
         self.val_metrics = []
         self.learning_rates = []
+        self._history_version += 1
+        self._status_cache = None
+        self._scanned_train = None
+        self._scanned_val = None
+        self._scanned_len = 0
+        self._scanned_val_len = 0
+        self._train_flags = (False, False, None)
+        self._val_flags = (False, False)
         self.best_val_metric = None
         self.best_epoch = 0
         self.epochs_since_improvement = 0
         self.converged = False
         self.overfitting_detected = False
         self.anomaly_detected = False
-        self.recent_metrics.clear()
+        self._rebuild_window()
 
     def __repr__(self) -> str:
         return (
@@ -7,10 +7,38 @@ Multi-level stopping criteria for ML experiments:
 - Level 3: Campaign stopping (entire experimentation campaign)
 """
 
+import functools
+import time
 import numpy as np
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
-from ..config import config
+from ..config import Config
+from ._stopping_kernels import low_improvement, window_moments
+
+# Shared stand-in for experiments without a 'metrics' dict
+_NO_METRICS = MappingProxyType({})
+
+
+def _single_decision(method):
+    """
+    Share extracted metric arrays between the checks of one public call
+
+    The arrays are dropped when the outermost decorated call returns, so every
+    decision reads the history as it is at that moment, including experiments
+    edited in place since the previous call.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._decision_arrays is not None:
+            # Nested call (e.g. generate_stopping_report -> should_stop_campaign)
+            return method(self, *args, **kwargs)
+        self._decision_arrays = {}
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._decision_arrays = None
+    return wrapper
 
 
 class StoppingCriteria:
@@ -24,11 +52,49 @@ class StoppingCriteria:
             criteria_config: Configuration dictionary. If None, uses config from lisa_config.yaml
         """
         if criteria_config is None:
-            criteria_config = config.get_stopping_criteria()
+            criteria_config = Config().get_stopping_criteria()
 
         self.config = criteria_config
         self.campaign_start_time = datetime.now()
 
+        # Per (id(history), metric) during one decision: (history, metric values,
+        # positions in history of the experiments reporting it); None between calls
+        self._decision_arrays: Optional[
+            Dict[Tuple[int, Any], Tuple[List[Dict[str, Any]], np.ndarray, np.ndarray]]
+        ] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Stopping criteria configuration"""
+        return self._config
+
+    @config.setter
+    def config(self, criteria_config: Dict[str, Any]):
+        # Resolve the per-criterion sections once instead of on every check
+        self._config = criteria_config
+        self._perf_cfg = criteria_config.get('performance', {})
+        self._improv_cfg = criteria_config.get('improvement', {})
+        self._conv_cfg = criteria_config.get('convergence', {})
+        self._res_cfg = criteria_config.get('resources', {})
+        self._metric_name = self._perf_cfg.get('metric', 'f1_score')
+
+    @property
+    def campaign_start_time(self) -> datetime:
+        """Wall-clock start of the campaign"""
+        return self._campaign_start_time
+
+    @campaign_start_time.setter
+    def campaign_start_time(self, start_time: datetime):
+        # Elapsed time is measured on the monotonic clock from here on
+        self._campaign_start_time = start_time
+        self._start_monotonic = time.monotonic() - (datetime.now() - start_time).total_seconds()
+
+    def _elapsed_hours(self, current_time: Optional[datetime] = None) -> float:
+        """Hours since the campaign started (at current_time, if given)"""
+        if current_time is None:
+            return (time.monotonic() - self._start_monotonic) / 3600
+        return (current_time - self._campaign_start_time).total_seconds() / 3600
+
     def should_stop_training(
         self,
         monitor: 'TrainingMonitor',
@@ -64,7 +130,7 @@ class StoppingCriteria:
         reasons = []
 
         # Check performance threshold
-        perf_config = self.config.get('performance', {})
+        perf_config = self._perf_cfg
         if perf_config.get('enabled', False):
             metric_name = perf_config.get('metric')
             threshold = perf_config.get('threshold')
@@ -82,6 +148,7 @@ class StoppingCriteria:
         # If no stopping criteria met, continue
         return False, "Experiment completed successfully", "CONTINUE"
 
+    @_single_decision
     def should_stop_campaign(
         self,
         experiment_history: List[Dict[str, Any]],
@@ -105,29 +172,25 @@ class StoppingCriteria:
         if not experiment_history:
             return False, "No experiments yet", "CONTINUE"
 
-        if current_time is None:
-            current_time = datetime.now()
-
         reasons = []
 
         # 1. Check performance threshold
-        perf_config = self.config.get('performance', {})
+        perf_config = self._perf_cfg
         if perf_config.get('enabled', False):
             metric_name = perf_config.get('metric')
             threshold = perf_config.get('threshold')
 
             # Check if any experiment achieved the threshold
-            for exp in experiment_history:
-                metrics = exp.get('metrics', {})
-                if metric_name in metrics and metrics[metric_name] >= threshold:
-                    return (
-                        True,
-                        f"Target performance achieved: {metric_name}={metrics[metric_name]:.4f} >= {threshold}",
-                        "STOP"
-                    )
+            first_hit, _ = self._scan_threshold(experiment_history, metric_name, threshold)
+            if first_hit is not None:
+                return (
+                    True,
+                    f"Target performance achieved: {metric_name}={first_hit:.4f} >= {threshold}",
+                    "STOP"
+                )
 
         # 2. Check improvement rate
-        improvement_config = self.config.get('improvement', {})
+        improvement_config = self._improv_cfg
         if improvement_config.get('enabled', False):
             min_improvement_pct = improvement_config.get('min_improvement_percent', 1.0)
             window_size = improvement_config.get('window_size', 5)
@@ -142,7 +205,7 @@ class StoppingCriteria:
                     return True, reason, "TRY_DIFFERENT_MODEL"
 
         # 3. Check convergence
-        convergence_config = self.config.get('convergence', {})
+        convergence_config = self._conv_cfg
         if convergence_config.get('enabled', False):
             max_variance = convergence_config.get('max_variance', 0.01)
             window_size = convergence_config.get('window_size', 10)
@@ -157,7 +220,7 @@ class StoppingCriteria:
                     return True, reason, "STOP"
 
         # 4. Check resource limits
-        resource_config = self.config.get('resources', {})
+        resource_config = self._res_cfg
         if resource_config.get('enabled', False):
             # Check max experiments
             max_experiments = resource_config.get('max_experiments')
@@ -171,7 +234,7 @@ class StoppingCriteria:
             # Check max time
             max_hours = resource_config.get('max_time_hours')
             if max_hours:
-                elapsed = (current_time - self.campaign_start_time).total_seconds() / 3600
+                elapsed = self._elapsed_hours(current_time)
                 if elapsed >= max_hours:
                     return (
                         True,
@@ -189,30 +252,17 @@ class StoppingCriteria:
     ) -> Tuple[bool, str]:
         """Check if improvement rate is below threshold"""
         # Get metric name from config
-        metric_name = self.config.get('performance', {}).get('metric', 'f1_score')
-
-        # Get recent experiments
-        recent = experiment_history[-window_size:]
+        metric_name = self._metric_name
 
-        # Extract metric values
-        metric_values = []
-        for exp in recent:
-            metrics = exp.get('metrics', {})
-            if metric_name in metrics:
-                metric_values.append(metrics[metric_name])
+        # Extract metric values of recent experiments
+        metric_values = self._window_values(experiment_history, metric_name, window_size)
 
         if len(metric_values) < 2:
             return False, "Not enough data for improvement check"
 
-        # Calculate improvements
-        improvements = []
-        for i in range(1, len(metric_values)):
-            if metric_values[i-1] > 0:
-                improvement_pct = ((metric_values[i] - metric_values[i-1]) / metric_values[i-1]) * 100
-                improvements.append(improvement_pct)
-
-        # Check if all recent improvements are below threshold
-        if improvements and all(imp < min_improvement_pct for imp in improvements):
+        # Check if all recent improvements (between consecutive experiments,
+        # from positive values only) are below threshold
+        if low_improvement(metric_values, float(min_improvement_pct)):
             return (
                 True,
                 f"Low improvement rate: all improvements < {min_improvement_pct}% in last {window_size} experiments"
@@ -228,24 +278,14 @@ class StoppingCriteria:
     ) -> Tuple[bool, str]:
         """Check if performance has converged"""
         # Get metric name from config
-        metric_name = self.config.get('performance', {}).get('metric', 'f1_score')
-
-        # Get recent experiments
-        recent = experiment_history[-window_size:]
+        metric_name = self._metric_name
 
-        # Extract metric values
-        metric_values = []
-        for exp in recent:
-            metrics = exp.get('metrics', {})
-            if metric_name in metrics:
-                metric_values.append(metrics[metric_name])
+        # Population variance of the recent experiments' metric, updated incrementally
+        count, variance = self._window_variance(experiment_history, metric_name, window_size)
 
-        if len(metric_values) < window_size:
+        if count < window_size:
             return False, "Not enough data for convergence check"
 
-        # Calculate variance
-        variance = np.var(metric_values)
-
         if variance < max_variance:
             return (
                 True,
@@ -254,6 +294,177 @@ class StoppingCriteria:
 
         return False, f"Not converged: variance {variance:.6f} >= {max_variance}"
 
+    def _get_metric_array(
+        self,
+        experiment_history: List[Dict[str, Any]],
+        metric_name: str
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a metric's values and the positions of the experiments reporting it
+
+        Within one public call the arrays are extracted once per history list
+        and metric and shared by every check.
+        """
+        key = (id(experiment_history), metric_name)
+        arrays = self._decision_arrays
+        if arrays is not None:
+            cached = arrays.get(key)
+            if cached is not None and cached[0] is experiment_history:
+                return cached[1], cached[2]
+
+        positions = [
+            i for i, exp in enumerate(experiment_history)
+            if metric_name in exp.get('metrics', _NO_METRICS)
+        ]
+        values = np.fromiter(
+            (experiment_history[i]['metrics'][metric_name] for i in positions),
+            dtype=np.float64,
+            count=len(positions)
+        )
+        positions = np.asarray(positions, dtype=np.intp)
+
+        if arrays is not None:
+            arrays[key] = (experiment_history, values, positions)
+        return values, positions
+
+    def _window_values(
+        self,
+        experiment_history: List[Dict[str, Any]],
+        metric_name: str,
+        window_size: int
+    ) -> np.ndarray:
+        """Metric values within experiment_history[-window_size:]"""
+        values, positions = self._get_metric_array(experiment_history, metric_name)
+        n = len(experiment_history)
+        # First history index inside the window, with list-slice semantics
+        window_start = n - len(range(n)[-window_size:])
+        return values[np.searchsorted(positions, window_start):]
+
+    def _scan_threshold(
+        self,
+        experiment_history: List[Dict[str, Any]],
+        metric_name: str,
+        threshold: float
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """First metric value reaching the threshold and the best value overall"""
+        values, _ = self._get_metric_array(experiment_history, metric_name)
+        if not values.size:
+            return None, None
+
+        # NaN compares False, so it never reaches the threshold and is skipped
+        # for the best value too (None when every value is NaN)
+        hits = np.flatnonzero(values >= threshold)
+        first_hit = float(values[hits[0]]) if hits.size else None
+        if np.isnan(values).all():
+            return first_hit, None
+        return first_hit, float(np.nanmax(values))
+
+    def _window_variance(
+        self,
+        experiment_history: List[Dict[str, Any]],
+        metric_name: str,
+        window_size: int
+    ) -> Tuple[int, float]:
+        """
+        Count and population variance (as np.var) of the metric within
+        experiment_history[-window_size:]
+        """
+        values = self._window_values(experiment_history, metric_name, window_size)
+        count = len(values)
+        if not count:
+            return 0, float('nan')
+
+        _, m2 = window_moments(values)
+        return count, max(m2, 0.0) / count
+
+    @_single_decision
+    def evaluate_all(
+        self,
+        experiment_history: List[Dict[str, Any]],
+        current_time: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Evaluate every campaign criterion at once (unlike should_stop_campaign,
+        which stops at the first one met)
+
+        All checks read the same metric array, so the history is scanned once.
+
+        Args:
+            experiment_history: List of experiment results
+            current_time: Current timestamp (for testing)
+
+        Returns:
+            Dictionary with threshold_met, improvement_ok, converged,
+            resources_exceeded and the reasons for every criterion met
+        """
+        n = len(experiment_history)
+        reasons = []
+
+        # Performance threshold
+        threshold_met = False
+        perf_config = self._perf_cfg
+        if perf_config.get('enabled', False):
+            metric_name = perf_config.get('metric')
+            threshold = perf_config.get('threshold')
+            _, best = self._scan_threshold(experiment_history, metric_name, threshold)
+            if best is not None:
+                if best >= threshold:
+                    threshold_met = True
+                    reasons.append(f"Target performance achieved: {metric_name}={best:.4f} >= {threshold}")
+
+        # Improvement rate
+        improvement_ok = True
+        improvement_config = self._improv_cfg
+        if improvement_config.get('enabled', False):
+            window_size = improvement_config.get('window_size', 5)
+            if n >= window_size:
+                low, reason = self._check_improvement_rate(
+                    experiment_history,
+                    improvement_config.get('min_improvement_percent', 1.0),
+                    window_size
+                )
+                if low:
+                    improvement_ok = False
+                    reasons.append(reason)
+
+        # Convergence
+        converged = False
+        convergence_config = self._conv_cfg
+        if convergence_config.get('enabled', False):
+            window_size = convergence_config.get('window_size', 10)
+            if n >= window_size:
+                converged, reason = self._check_convergence(
+                    experiment_history,
+                    convergence_config.get('max_variance', 0.01),
+                    window_size
+                )
+                if converged:
+                    reasons.append(reason)
+
+        # Resource limits
+        resources_exceeded = False
+        resource_config = self._res_cfg
+        if resource_config.get('enabled', False):
+            max_experiments = resource_config.get('max_experiments')
+            if max_experiments and n >= max_experiments:
+                resources_exceeded = True
+                reasons.append(f"Maximum experiments reached: {n} >= {max_experiments}")
+
+            max_hours = resource_config.get('max_time_hours')
+            if max_hours:
+                elapsed = self._elapsed_hours(current_time)
+                if elapsed >= max_hours:
+                    resources_exceeded = True
+                    reasons.append(f"Maximum time exceeded: {elapsed:.1f}h >= {max_hours}h")
+
+        return {
+            'threshold_met': threshold_met,
+            'improvement_ok': improvement_ok,
+            'converged': converged,
+            'resources_exceeded': resources_exceeded,
+            'reasons': reasons
+        }
+
     def evaluate_performance_threshold(
         self,
         best_metric: float,
@@ -262,6 +473,7 @@ class StoppingCriteria:
         """Check if performance threshold is met"""
         return best_metric >= threshold
 
+    @_single_decision
     def evaluate_improvement_rate(
         self,
         recent_experiments: List[Dict[str, Any]],
@@ -276,6 +488,7 @@ class StoppingCriteria:
         )
         return not should_stop  # Return True if improvement is acceptable
 
+    @_single_decision
     def evaluate_convergence(
         self,
         recent_experiments: List[Dict[str, Any]],
@@ -303,7 +516,7 @@ class StoppingCriteria:
             Tuple of (limits_exceeded: bool, reasons: List[str])
         """
         if config is None:
-            config = self.config.get('resources', {})
+            config = self._res_cfg
 
         reasons = []
 
@@ -315,12 +528,16 @@ class StoppingCriteria:
         # Check time
         max_hours = config.get('max_time_hours')
         if max_hours:
-            elapsed_hours = (datetime.now() - start_time).total_seconds() / 3600
+            if start_time is self._campaign_start_time:
+                elapsed_hours = self._elapsed_hours()
+            else:
+                elapsed_hours = (datetime.now() - start_time).total_seconds() / 3600
             if elapsed_hours >= max_hours:
                 reasons.append(f"Max time: {elapsed_hours:.1f}h >= {max_hours}h")
 
         return len(reasons) > 0, reasons
 
+    @_single_decision
     def get_best_experiment(
         self,
         experiment_history: List[Dict[str, Any]],
@@ -340,25 +557,19 @@ class StoppingCriteria:
             return None
 
         if metric_name is None:
-            metric_name = self.config.get('performance', {}).get('metric', 'f1_score')
+            metric_name = self._metric_name
 
-        # Filter experiments with the metric
-        valid_experiments = [
-            exp for exp in experiment_history
-            if metric_name in exp.get('metrics', {})
-        ]
+        # Values and positions of the experiments with the metric
+        metric_values, positions = self._get_metric_array(experiment_history, metric_name)
 
-        if not valid_experiments:
+        # Experiments with a NaN metric are never the best
+        if not metric_values.size or np.isnan(metric_values).all():
             return None
 
-        # Find best
-        best = max(
-            valid_experiments,
-            key=lambda exp: exp['metrics'][metric_name]
-        )
-
-        return best
+        # Find best (first one on ties)
+        return experiment_history[positions[np.nanargmax(metric_values)]]
 
+    @_single_decision
     def generate_stopping_report(
         self,
         experiment_history: List[Dict[str, Any]]
@@ -378,32 +589,36 @@ class StoppingCriteria:
         best_experiment = self.get_best_experiment(experiment_history)
 
         # Calculate statistics
-        metric_name = self.config.get('performance', {}).get('metric', 'f1_score')
-        metric_values = [
-            exp['metrics'][metric_name]
-            for exp in experiment_history
-            if metric_name in exp.get('metrics', {})
-        ]
+        metric_name = self._metric_name
+        metric_values, _ = self._get_metric_array(experiment_history, metric_name)
+
+        best_value = mean_value = std_value = improvement = None
+        if metric_values.size:
+            best_value = float(metric_values.max())
+            # Same arithmetic as ndarray.std(), reusing the mean instead of recomputing it
+            mean_value = metric_values.mean()
+            deviations = metric_values - mean_value
+            std_value = np.sqrt(np.square(deviations, out=deviations).sum() / metric_values.size)
+            if metric_values.size >= 2:
+                improvement = float(metric_values[-1] - metric_values[0])
 
         report = {
             'should_stop': should_stop,
             'reasoning': reasoning,
             'next_action': next_action,
             'total_experiments': len(experiment_history),
-            'elapsed_time_hours': (datetime.now() - self.campaign_start_time).total_seconds() / 3600,
+            'elapsed_time_hours': self._elapsed_hours(),
             'best_experiment': best_experiment,
             'statistics': {
                 'metric_name': metric_name,
-                'best_value': max(metric_values) if metric_values else None,
-                'mean_value': np.mean(metric_values) if metric_values else None,
-                'std_value': np.std(metric_values) if metric_values else None,
-                'improvement_from_first': (
-                    metric_values[-1] - metric_values[0] if len(metric_values) >= 2 else None
-                )
+                'best_value': best_value,
+                'mean_value': mean_value,
+                'std_value': std_value,
+                'improvement_from_first': improvement
             }
         }
 
         return report
 
     def __repr__(self) -> str:
-        return f"StoppingCriteria(experiments=?, elapsed={datetime.now() - self.campaign_start_time})"
+        return f"StoppingCriteria(experiments=?, elapsed={timedelta(hours=self._elapsed_hours())})"
@@ -10,9 +10,10 @@ from typing import Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 import joblib
 import json
+from threadpoolctl import threadpool_limits
 
 # ML Libraries
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
 from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.linear_model import LogisticRegression, LinearRegression
 from sklearn.svm import SVC, SVR
@@ -29,6 +30,46 @@ try:
 except ImportError:
     HAS_LIGHTGBM = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import lz4  # noqa: F401
+    HAS_LZ4 = True
+except ImportError:
+    HAS_LZ4 = False
+
+# Physical (not logical) cores: default n_jobs and the BLAS thread cap during training
+PHYSICAL_CORES = joblib.cpu_count(only_physical_cores=True)
+
+# Checkpoint compression: lz4 when available (fast), otherwise zlib at a light level.
+# joblib.load detects the format, so older uncompressed checkpoints still load.
+CHECKPOINT_COMPRESS = ('lz4', 3) if HAS_LZ4 else ('zlib', 3)
+
+
+def _json_compatible(obj: Any) -> Any:
+    """
+    Copy of checkpoint metadata that orjson and json serialise identically
+
+    NumPy scalars and arrays become Python numbers and lists, and NaN/Inf become
+    None. orjson writes those as null while json would write the non-standard
+    NaN/Infinity tokens.
+    """
+    if isinstance(obj, dict):
+        return {key: _json_compatible(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_compatible(value) for value in obj]
+    if isinstance(obj, np.ndarray):
+        return _json_compatible(obj.tolist())
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and not np.isfinite(obj):
+        return None
+    return obj
+
 
 class ModelTrainer:
     """Unified interface for training ML models"""
@@ -44,6 +85,10 @@ class ModelTrainer:
         ]
     }
 
+    # Tree ensembles that cast features to float32 internally before fitting
+    # and predicting, so handing them float32 input is lossless
+    FLOAT32_MODELS = ('random_forest', 'xgboost')
+
     def __init__(self, task_type: str = 'classification', random_seed: int = 42, verbose: bool = True):
         """
         Initialize trainer
@@ -59,6 +104,9 @@ class ModelTrainer:
         self.model = None
         self.training_history = []
 
+        # "feature_<i>" names used when importances are requested without names
+        self._generic_feature_names = []
+
     def prepare_data(
         self,
         X: Union[pd.DataFrame, np.ndarray],
@@ -78,25 +126,42 @@ class ModelTrainer:
         Returns:
             Tuple of (X_train, X_val, X_test, y_train, y_val, y_test)
         """
+        # Same splitters train_test_split uses, but on row indices only so X is
+        # sliced once per split instead of copying an intermediate train+val set
+        stratify = self.task_type == 'classification'
+        splitter = StratifiedShuffleSplit if stratify else ShuffleSplit
+
         # First split: separate test set
-        X_temp, X_test, y_temp, y_test = train_test_split(
-            X, y,
-            test_size=test_size,
-            random_state=self.random_seed,
-            stratify=y if self.task_type == 'classification' else None
+        temp_idx, test_idx = next(
+            splitter(n_splits=1, test_size=test_size, random_state=self.random_seed)
+            .split(X, y)
         )
 
         # Second split: separate validation set from remaining data
         val_proportion = val_size / (1 - test_size)
-        X_train, X_val, y_train, y_val = train_test_split(
-            X_temp, y_temp,
-            test_size=val_proportion,
-            random_state=self.random_seed,
-            stratify=y_temp if self.task_type == 'classification' else None
+        y_temp = self._take_rows(y, temp_idx) if stratify else None
+        train_pos, val_pos = next(
+            splitter(n_splits=1, test_size=val_proportion, random_state=self.random_seed)
+            .split(temp_idx, y_temp)
         )
+        train_idx = temp_idx[train_pos]
+        val_idx = temp_idx[val_pos]
+
+        X_train, X_val, X_test = (self._take_rows(X, idx) for idx in (train_idx, val_idx, test_idx))
+        y_train, y_val, y_test = (self._take_rows(y, idx) for idx in (train_idx, val_idx, test_idx))
 
         return X_train, X_val, X_test, y_train, y_val, y_test
 
+    @staticmethod
+    def _take_rows(
+        data: Union[pd.DataFrame, pd.Series, np.ndarray],
+        idx: np.ndarray
+    ) -> Union[pd.DataFrame, pd.Series, np.ndarray]:
+        """Rows at the given positions, keeping pandas objects (and their index) as they are"""
+        if isinstance(data, (pd.DataFrame, pd.Series)):
+            return data.iloc[idx]
+        return np.asarray(data)[idx]
+
     def create_model(
         self,
         model_type: str,
@@ -201,74 +266,97 @@ class ModelTrainer:
         # Create model
         self.model = self.create_model(model_type, params)
 
-        # Train with or without validation
-        if X_val is not None and y_val is not None:
-            # Models that support early stopping and callbacks
-            if model_type in ['xgboost', 'lightgbm']:
-                if model_type == 'xgboost':
-                    # Get number of estimators for progress bar
-                    n_estimators = params.get('n_estimators', 100) if params else 100
-
-                    # Create progress callback if verbose
-                    if self.verbose:
-                        print(f"\n🚀 Starting XGBoost training ({n_estimators} rounds)...")
-                        progress_callback = XGBoostProgressCallback(
-                            total_rounds=n_estimators,
-                            monitor=monitor,
-                            mlflow_mgr=mlflow_mgr,
-                            metric_name='logloss' if self.task_type == 'classification' else 'rmse'
+        # The boosting wrappers build their training DMatrix/Dataset once and
+        # reuse it for an eval_set entry holding the very same X/y objects, so
+        # the converted arrays below must be passed to fit() unchanged. The
+        # cache lives for this call only: callers may modify X in place between
+        # train() calls, so an earlier conversion cannot be trusted later
+        if model_type in self.FLOAT32_MODELS:
+            cache = {}
+            X_train = self._as_float32(X_train, cache)
+            if X_val is not None:
+                X_val = self._as_float32(X_val, cache)
+
+        # Cap BLAS threads at the physical core count so linear algebra inside
+        # fit/score does not oversubscribe hyperthreads
+        with threadpool_limits(limits=PHYSICAL_CORES, user_api='blas'):
+            # Train with or without validation
+            if X_val is not None and y_val is not None:
+                # Models that support early stopping and callbacks
+                if model_type in ['xgboost', 'lightgbm']:
+                    if model_type == 'xgboost':
+                        # Get number of estimators for progress bar
+                        n_estimators = params.get('n_estimators', 100) if params else 100
+
+                        # Create progress callback if verbose
+                        if self.verbose:
+                            print(f"\n🚀 Starting XGBoost training ({n_estimators} rounds)...")
+                            progress_callback = XGBoostProgressCallback(
+                                total_rounds=n_estimators,
+                                monitor=monitor,
+                                mlflow_mgr=mlflow_mgr,
+                                metric_name='logloss' if self.task_type == 'classification' else 'rmse'
+                            )
+                            custom_callbacks = [progress_callback]
+                        else:
+                            custom_callbacks = []
+
+                        self.model.fit(
+                            X_train, y_train,
+                            eval_set=[(X_train, y_train), (X_val, y_val)],
+                            callbacks=custom_callbacks,
+                            verbose=False
                         )
-                        custom_callbacks = [progress_callback]
-                    else:
-                        custom_callbacks = []
-
-                    self.model.fit(
-                        X_train, y_train,
-                        eval_set=[(X_train, y_train), (X_val, y_val)],
-                        callbacks=custom_callbacks,
-                        verbose=False
-                    )
-
-                    if self.verbose and custom_callbacks:
-                        # Close progress bar
-                        progress_callback.close()
-
-                    # Get training history from evals_result
-                    results = self.model.evals_result()
-                    self.training_history = results.get('validation_1', {})
-
-                elif model_type == 'lightgbm':
-                    # Get number of estimators for progress bar
-                    n_estimators = params.get('n_estimators', 100) if params else 100
-
-                    # Create progress callback if verbose
-                    callbacks_list = [lgb.early_stopping(50), lgb.log_evaluation(0)]
 
-                    if self.verbose:
-                        print(f"\n🚀 Starting LightGBM training ({n_estimators} rounds)...")
-                        progress_callback = LightGBMProgressCallback(
-                            total_rounds=n_estimators,
-                            monitor=monitor,
-                            mlflow_mgr=mlflow_mgr,
-                            metric_name='binary_logloss' if self.task_type == 'classification' else 'rmse'
+                        if self.verbose and custom_callbacks:
+                            # Close progress bar
+                            progress_callback.close()
+
+                        # Get training history from evals_result
+                        results = self.model.evals_result()
+                        self.training_history = results.get('validation_1', {})
+
+                    elif model_type == 'lightgbm':
+                        # Get number of estimators for progress bar
+                        n_estimators = params.get('n_estimators', 100) if params else 100
+
+                        # Create progress callback if verbose
+                        callbacks_list = [lgb.early_stopping(50), lgb.log_evaluation(0)]
+
+                        if self.verbose:
+                            print(f"\n🚀 Starting LightGBM training ({n_estimators} rounds)...")
+                            progress_callback = LightGBMProgressCallback(
+                                total_rounds=n_estimators,
+                                monitor=monitor,
+                                mlflow_mgr=mlflow_mgr,
+                                metric_name='binary_logloss' if self.task_type == 'classification' else 'rmse'
+                            )
+                            callbacks_list.append(progress_callback)
+
+                        self.model.fit(
+                            X_train, y_train,
+                            eval_set=[(X_train, y_train), (X_val, y_val)],
+                            callbacks=callbacks_list
                         )
-                        callbacks_list.append(progress_callback)
-
-                    self.model.fit(
-                        X_train, y_train,
-                        eval_set=[(X_train, y_train), (X_val, y_val)],
-                        callbacks=callbacks_list
-                    )
 
-                    if self.verbose:
-                        # Close progress bar
-                        progress_callback.close()
+                        if self.verbose:
+                            # Close progress bar
+                            progress_callback.close()
 
-                    # Get training history
-                    self.training_history = self.model.evals_result_
+                        # Get training history
+                        self.training_history = self.model.evals_result_
 
+                else:
+                    # Standard sklearn models with progress wrapper
+                    if self.verbose:
+                        model_name = model_type.replace('_', ' ').title()
+                        print(f"\n🤖 Training {model_name}...")
+                        wrapper = GenericProgressWrapper(desc=model_name)
+                        wrapper.train_with_progress(self.model, X_train, y_train)
+                    else:
+                        self.model.fit(X_train, y_train)
             else:
-                # Standard sklearn models with progress wrapper
+                # Train without validation
                 if self.verbose:
                     model_name = model_type.replace('_', ' ').title()
                     print(f"\n🤖 Training {model_name}...")
@@ -276,19 +364,10 @@ class ModelTrainer:
                     wrapper.train_with_progress(self.model, X_train, y_train)
                 else:
                     self.model.fit(X_train, y_train)
-        else:
-            # Train without validation
-            if self.verbose:
-                model_name = model_type.replace('_', ' ').title()
-                print(f"\n🤖 Training {model_name}...")
-                wrapper = GenericProgressWrapper(desc=model_name)
-                wrapper.train_with_progress(self.model, X_train, y_train)
-            else:
-                self.model.fit(X_train, y_train)
 
-        # Evaluate on training data
-        train_score = self.model.score(X_train, y_train)
-        val_score = self.model.score(X_val, y_val) if X_val is not None else None
+            # Evaluate on training data
+            train_score = self.model.score(X_train, y_train)
+            val_score = self.model.score(X_val, y_val) if X_val is not None else None
 
         results = {
             'model_type': model_type,
@@ -300,6 +379,35 @@ class ModelTrainer:
 
         return results
 
+    def _as_float32(
+        self,
+        X: Union[pd.DataFrame, np.ndarray],
+        cache: Dict[int, Tuple[Any, Any]]
+    ) -> Union[pd.DataFrame, np.ndarray]:
+        """
+        Cast float64 features to contiguous float32 once
+
+        DataFrames keep their columns (and so feature names); only float64
+        columns are cast. Conversions are reused when the same object is
+        passed again with the same cache.
+        """
+        cached = cache.get(id(X))
+        if cached is not None and cached[0] is X:
+            return cached[1]
+
+        if isinstance(X, pd.DataFrame):
+            float_cols = X.columns[X.dtypes == np.float64]
+            if not len(float_cols):
+                return X
+            converted = X.astype({col: np.float32 for col in float_cols})
+        elif isinstance(X, np.ndarray) and X.dtype == np.float64:
+            converted = np.ascontiguousarray(X, dtype=np.float32)
+        else:
+            return X
+
+        cache[id(X)] = (X, converted)
+        return converted
+
     def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
         """Make predictions"""
         if self.model is None:
@@ -337,12 +445,16 @@ class ModelTrainer:
             return None
 
         if hasattr(self.model, 'feature_importances_'):
-            importances = self.model.feature_importances_
+            importances = np.asarray(self.model.feature_importances_).tolist()
 
             if feature_names:
                 return dict(zip(feature_names, importances))
-            else:
-                return {f"feature_{i}": imp for i, imp in enumerate(importances)}
+
+            # Generic names are built once and extended only if more are needed
+            names = self._generic_feature_names
+            if len(names) < len(importances):
+                names.extend(f"feature_{i}" for i in range(len(names), len(importances)))
+            return dict(zip(names, importances))
 
         return None
 
@@ -366,7 +478,7 @@ class ModelTrainer:
 
         # Save model
         model_path = path.with_suffix('.pkl')
-        joblib.dump(self.model, model_path)
+        joblib.dump(self.model, model_path, compress=CHECKPOINT_COMPRESS)
 
         # Save metadata
         checkpoint_data = {
@@ -376,9 +488,16 @@ class ModelTrainer:
             'metadata': metadata or {}
         }
 
+        # Same JSON from either serialiser, with NaN/Inf stored as null
+        checkpoint_data = _json_compatible(checkpoint_data)
+
+        # Compact output: boosting histories hold one float per round and metric
         metadata_path = path.with_suffix('.json')
-        with open(metadata_path, 'w') as f:
-            json.dump(checkpoint_data, f, indent=2)
+        if HAS_ORJSON:
+            metadata_path.write_bytes(orjson.dumps(checkpoint_data, option=orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(metadata_path, 'w') as f:
+                json.dump(checkpoint_data, f, separators=(',', ':'))
 
     def load_checkpoint(self, path: Path):
         """
@@ -418,7 +537,7 @@ class ModelTrainer:
                 'max_depth': None,
                 'min_samples_split': 2,
                 'min_samples_leaf': 1,
-                'n_jobs': -1
+                'n_jobs': PHYSICAL_CORES
             },
             'xgboost': {
                 'n_estimators': 100,
@@ -426,22 +545,22 @@ class ModelTrainer:
                 'learning_rate': 0.1,
                 'subsample': 0.8,
                 'colsample_bytree': 0.8,
-                'n_jobs': -1
+                'n_jobs': PHYSICAL_CORES
             },
             'lightgbm': {
                 'n_estimators': 100,
                 'max_depth': -1,
                 'learning_rate': 0.1,
                 'num_leaves': 31,
-                'n_jobs': -1
+                'n_jobs': PHYSICAL_CORES
             },
             'logistic_regression': {
                 'C': 1.0,
                 'max_iter': 1000,
-                'n_jobs': -1
+                'n_jobs': PHYSICAL_CORES
             },
             'linear_regression': {
-                'n_jobs': -1
+                'n_jobs': PHYSICAL_CORES
             },
             'svm': {
                 'C': 1.0,
@@ -9,7 +9,7 @@ import os
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from .config import config
+from .config import Config
 
 
 class Diary:
@@ -36,7 +36,7 @@ class Diary:
             diary_path: Path to diary directory. If None, uses config.
         """
         if diary_path is None:
-            self.diary_path = config.get_path('diary')
+            self.diary_path = Config().get_path('diary')
         else:
             self.diary_path = Path(diary_path)
 
@@ -4,12 +4,306 @@ LISA MLflow Manager
 Manages MLflow experiment tracking, logging, and model registry.
 """
 
+import atexit
+import json
+import os
+import queue
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+import threading
+import time
+import weakref
 import mlflow
+import pandas as pd
+from mlflow.exceptions import MlflowException
 from mlflow.tracking import MlflowClient
-from mlflow.entities import ViewType
-from typing import Dict, Any, List, Optional, Tuple
+from mlflow.entities import Metric, Param, RunTag, ViewType
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
-from .config import config
+from .config import Config
+
+# Tracking server limits for a single log_batch request
+MAX_METRICS_PER_BATCH = 1000
+MAX_PARAMS_TAGS_PER_BATCH = 100
+MAX_ENTITIES_PER_BATCH = 1000
+
+# Experiment IDs already resolved on remote http(s) tracking servers:
+# {tracking_uri: {name: id}}. Local backends (file:, sqlite:, ...) are recreated
+# too easily for a stored ID to stay meaningful, so they are never cached
+_EXPERIMENT_CACHE_PATH = Path.home() / '.cache' / 'lisa' / 'mlflow_experiments.json'
+
+
+def _read_experiment_cache() -> Dict[str, Dict[str, str]]:
+    """Load the experiment ID cache (empty if missing or unreadable)"""
+    try:
+        with open(_EXPERIMENT_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _write_experiment_cache(tracking_uri: str, experiment_name: str, experiment_id: Optional[str]):
+    """Store (or with experiment_id=None, drop) one cached experiment ID"""
+    cache = _read_experiment_cache()
+    by_name = cache.setdefault(tracking_uri, {})
+    if experiment_id is None:
+        by_name.pop(experiment_name, None)
+    else:
+        by_name[experiment_name] = experiment_id
+
+    # Written to a temporary file and renamed over the cache, so concurrent
+    # processes never see (or leave behind) a partly written file
+    tmp_path = None
+    try:
+        _EXPERIMENT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            'w', dir=_EXPERIMENT_CACHE_PATH.parent, suffix='.tmp', delete=False
+        ) as f:
+            tmp_path = f.name
+            json.dump(cache, f)
+        os.replace(tmp_path, _EXPERIMENT_CACHE_PATH)
+    except OSError:
+        # The cache only saves a lookup
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+# Large artifacts on proxied (http/https) servers go up as MLflow multipart uploads;
+# 64 MB parts from 128 MB on. Environment settings from the user take precedence.
+_MULTIPART_UPLOAD_DEFAULTS = {
+    'MLFLOW_ENABLE_PROXY_MULTIPART_UPLOAD': 'true',
+    'MLFLOW_MULTIPART_UPLOAD_MINIMUM_FILE_SIZE': str(128 * 1024 * 1024),
+    'MLFLOW_MULTIPART_UPLOAD_CHUNK_SIZE': str(64 * 1024 * 1024),
+}
+
+
+# Queue markers asking the worker to send what it has without waiting out its
+# window, and to stop once that is sent
+_FLUSH = object()
+_STOP = object()
+
+
+def _iter_batches(metrics: List[Metric], params: List[Param], tags: List[RunTag]):
+    """Split entities into (metrics, params, tags) chunks within the log_batch limits"""
+    while metrics or params or tags:
+        n_params = min(len(params), MAX_PARAMS_TAGS_PER_BATCH)
+        n_tags = min(len(tags), MAX_PARAMS_TAGS_PER_BATCH)
+        n_metrics = min(len(metrics), MAX_ENTITIES_PER_BATCH - n_params - n_tags)
+        yield metrics[:n_metrics], params[:n_params], tags[:n_tags]
+        metrics = metrics[n_metrics:]
+        params = params[n_params:]
+        tags = tags[n_tags:]
+
+
+class _AsyncMlflowWorker:
+    """Daemon thread sending queued log_batch requests off the caller's thread"""
+
+    def __init__(
+        self,
+        client: MlflowClient,
+        coalesce_seconds: float = 0.1,
+        maxsize: int = 10000
+    ):
+        self._client = client
+        self._coalesce_seconds = coalesce_seconds
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+        # First send failure per run, handed to the caller's thread by pop_error().
+        # Until then later entities of that run are dropped, as they would never
+        # have been logged had the failing call raised where it was made
+        self._errors: Dict[str, Exception] = {}
+        self._errors_lock = threading.Lock()
+
+    def submit(
+        self,
+        run_id: str,
+        metrics: List[Metric],
+        params: List[Param],
+        tags: List[RunTag]
+    ):
+        """Queue entities for a run; blocks only while the queue is full"""
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='lisa-mlflow-logger', daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((run_id, metrics, params, tags))
+
+    def join(self):
+        """Block until everything submitted so far has been sent"""
+        if self._thread is not None:
+            self._queue.put(_FLUSH)
+            self._queue.join()
+
+    def close(self):
+        """Stop the thread once everything submitted so far has been sent"""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+
+    def pop_error(self, run_id: Optional[str] = None) -> Optional[Exception]:
+        """First failed send of a run (of any run if run_id is None), clearing it"""
+        with self._errors_lock:
+            if run_id is not None:
+                return self._errors.pop(run_id, None)
+            errors = list(self._errors.values())
+            self._errors.clear()
+        return errors[0] if errors else None
+
+    def _run(self):
+        q = self._queue
+        while True:
+            items = [q.get()]
+
+            # Coalesce whatever else arrives within the window
+            deadline = time.monotonic() + self._coalesce_seconds
+            while items[-1] is not _FLUSH and items[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                self._send([item for item in items if item is not _FLUSH and item is not _STOP])
+            finally:
+                for _ in items:
+                    q.task_done()
+
+            if items[-1] is _STOP:
+                return
+
+    def _send(self, items: List[Tuple[str, List[Metric], List[Param], List[RunTag]]]):
+        # Each item's metrics and tags were logged before its params. Consecutive
+        # items of a run are merged while that keeps this order (metrics and tags
+        # only join a group that has no params yet), and never with two values
+        # for one param key
+        groups = []
+        for run_id, metrics, params, tags in items:
+            if groups:
+                group = groups[-1]
+                if (
+                    group[0] == run_id
+                    and (not group[2] or not (metrics or tags))
+                    and group[2].keys().isdisjoint(p.key for p in params)
+                ):
+                    group[1].extend(metrics)
+                    group[2].update((p.key, p) for p in params)
+                    group[3].update((t.key, t) for t in tags)
+                    continue
+            groups.append((
+                run_id,
+                list(metrics),
+                {p.key: p for p in params},
+                {t.key: t for t in tags}
+            ))
+
+        for run_id, metrics, params, tags in groups:
+            if run_id in self._errors:
+                continue  # Logged after a call of this run that failed
+
+            # Params go in their own requests: a rejected param overwrite must not
+            # take the metrics and tags logged before it down too
+            if not self._log_batches(run_id, metrics, [], list(tags.values())):
+                continue
+
+            params = list(params.values())
+            if not self._log_batches(run_id, [], params, []) and len(params) > 1:
+                # Resend one by one so only the rejected params are lost
+                for param in params:
+                    self._log_batches(run_id, [], [param], [])
+
+    def _log_batches(
+        self,
+        run_id: str,
+        metrics: List[Metric],
+        params: List[Param],
+        tags: List[RunTag]
+    ) -> bool:
+        """Send entities in log_batch-sized requests; False (error kept) if one fails"""
+        try:
+            for batch in _iter_batches(metrics, params, tags):
+                self._client.log_batch(run_id, metrics=batch[0], params=batch[1], tags=batch[2])
+        except Exception as e:
+            # Runs on the worker thread; the caller sees it when the run exits
+            # or on an explicit flush()
+            with self._errors_lock:
+                self._errors.setdefault(run_id, e)
+            return False
+        return True
+
+
+# Managers to drain at exit. Held weakly so registering does not keep them alive
+_LIVE_MANAGERS: 'weakref.WeakSet[MLflowManager]' = weakref.WeakSet()
+
+
+def _flush_managers_at_exit():
+    """Send what every live manager still has buffered or queued"""
+    for manager in list(_LIVE_MANAGERS):
+        manager._flush_and_join()
+
+
+atexit.register(_flush_managers_at_exit)
+
+
+def _quote_filter_value(value: Any) -> str:
+    """Quote a string literal for an MLflow search filter"""
+    value = str(value)
+    return f'"{value}"' if "'" in value else f"'{value}'"
+
+
+# MLflow flavour per model module substring, checked in order
+# (so e.g. xgboost.sklearn / lightgbm.sklearn estimators use the sklearn flavour)
+_MODEL_FLAVOURS = (
+    ('sklearn', 'sklearn'),
+    ('xgboost', 'xgboost'),
+    ('lightgbm', 'lightgbm'),
+    ('torch', 'pytorch'),
+)
+
+
+@lru_cache(maxsize=256)
+def _model_flavour(model_class: type) -> Optional[str]:
+    """MLflow flavour module name for a model class (None for the pyfunc fallback)"""
+    module = str(model_class.__module__)
+    for marker, flavour in _MODEL_FLAVOURS:
+        if marker in module:
+            return flavour
+    return None
+
+
+class _FlushingRun(mlflow.ActiveRun):
+    """mlflow.ActiveRun that sends all buffered logs before the run ends"""
+
+    def __init__(self, active_run: mlflow.ActiveRun, manager: 'MLflowManager'):
+        super().__init__(active_run)
+        self._manager = manager
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # Wait for the background logger so nothing is still in flight when the run ends
+        try:
+            self._manager._drain()
+        except BaseException:
+            super().__exit__(exc_type, exc_val, exc_tb)
+            raise
+
+        # A failed background send of this run fails the run and is raised from
+        # the with block, unless the block is already raising
+        error = self._manager._worker.pop_error(self.info.run_id)
+        if error is None or exc_type is not None:
+            return super().__exit__(exc_type, exc_val, exc_tb)
+        super().__exit__(type(error), error, error.__traceback__)
+        raise error
 
 
 class MLflowManager:
@@ -17,18 +311,107 @@ class MLflowManager:
 
     def __init__(self):
         """Initialize MLflow manager with configuration"""
+        config = Config()
         self.tracking_uri = config.mlflow_tracking_uri
         self.experiment_name = config.mlflow_experiment_name
 
         # Set tracking URI
         mlflow.set_tracking_uri(self.tracking_uri)
 
-        # Create or get experiment
-        self.experiment = self._get_or_create_experiment()
+        if self.tracking_uri.startswith(('http://', 'https://')):
+            for name, value in _MULTIPART_UPLOAD_DEFAULTS.items():
+                os.environ.setdefault(name, value)
+
+        # Create or get experiment (a disk-cached ID is checked on first use)
+        self._experiment_id = self._resolve_experiment_id()
 
         # Initialize client
         self.client = MlflowClient(tracking_uri=self.tracking_uri)
 
+        # Metrics, params and tags are buffered per run and handed to a background
+        # worker that sends them with log_batch, so logging never waits on the server
+        self._pending_run_id: Optional[str] = None
+        self._pending_metrics: List[Metric] = []
+        self._pending_params: Dict[str, Param] = {}
+        self._pending_tags: Dict[str, RunTag] = {}
+        self._worker = _AsyncMlflowWorker(self.client)
+
+        # Guards the buffers and the fluent run lookups, which are not thread-safe
+        self._lock = threading.RLock()
+
+        # Drained by the module's atexit hook (runs used without a context manager
+        # rely on it); the worker thread stops when the manager is collected
+        _LIVE_MANAGERS.add(self)
+        weakref.finalize(self, self._worker.close)
+
+    @property
+    def experiment_id(self) -> str:
+        """ID of the tracked experiment"""
+        if self._experiment_from_cache:
+            self._check_cached_experiment()
+        return self._experiment_id
+
+    @experiment_id.setter
+    def experiment_id(self, experiment_id: str):
+        self._experiment_id = experiment_id
+        self._experiment_from_cache = False
+        self.__dict__.pop('experiment', None)
+
+    @cached_property
+    def experiment(self) -> mlflow.entities.Experiment:
+        """The tracked MLflow experiment"""
+        experiment_id = self.experiment_id
+        # Checking a cached ID already fetched the experiment
+        experiment = self.__dict__.get('experiment')
+        return experiment if experiment is not None else mlflow.get_experiment(experiment_id)
+
+    def _resolve_experiment_id(self, use_cache: bool = True) -> str:
+        """
+        Experiment ID for the configured name
+
+        On remote http(s) tracking servers the ID is cached on disk so new
+        processes need not look it up by name before their first request;
+        other backends are always looked up.
+        """
+        self._experiment_from_cache = False
+        cacheable = self.tracking_uri.startswith(('http://', 'https://'))
+
+        if cacheable and use_cache:
+            cached = _read_experiment_cache().get(self.tracking_uri, {}).get(self.experiment_name)
+            if isinstance(cached, str):
+                self._experiment_from_cache = True
+                return cached
+
+        experiment = self._get_or_create_experiment()
+        self.__dict__['experiment'] = experiment
+        if cacheable:
+            _write_experiment_cache(self.tracking_uri, self.experiment_name, experiment.experiment_id)
+        return experiment.experiment_id
+
+    def _check_cached_experiment(self):
+        """
+        Confirm on first use that a disk-cached ID still names the configured,
+        active experiment; otherwise drop it and look the name up again
+        """
+        self._experiment_from_cache = False
+        try:
+            experiment = mlflow.get_experiment(self._experiment_id)
+        except MlflowException:
+            experiment = None
+
+        if (
+            experiment is not None
+            and experiment.name == self.experiment_name
+            and experiment.lifecycle_stage == 'active'
+        ):
+            self.__dict__['experiment'] = experiment
+            return
+
+        # The experiment was deleted, renamed, or the server was reset
+        _write_experiment_cache(self.tracking_uri, self.experiment_name, None)
+        self.__dict__.pop('experiment', None)
+        self._experiment_id = self._resolve_experiment_id(use_cache=False)
+
     def _get_or_create_experiment(self) -> mlflow.entities.Experiment:
         """Get existing experiment or create new one"""
         experiment = mlflow.get_experiment_by_name(self.experiment_name)
@@ -55,22 +438,123 @@ class MLflowManager:
             tags: Additional tags for the run
 
         Returns:
-            Active MLflow run context
+            Active MLflow run context (sends buffered logs before the run ends)
         """
         if tags is None:
             tags = {}
 
         tags.setdefault("created_by", "LISA")
 
-        return mlflow.start_run(
-            experiment_id=self.experiment.experiment_id,
-            run_name=run_name,
-            tags=tags
-        )
+        with self._lock:
+            self._submit_pending()
+
+            active_run = mlflow.start_run(
+                experiment_id=self.experiment_id,
+                run_name=run_name,
+                tags=tags
+            )
+        return _FlushingRun(active_run, self)
+
+    def _active_run_id(self) -> str:
+        """ID of the active run, starting one if needed (like mlflow.log_*)"""
+        with self._lock:
+            run = mlflow.active_run() or mlflow.start_run()
+        return run.info.run_id
+
+    def _buffer_run_id(self) -> str:
+        """Run the next buffered entries belong to"""
+        run_id = self._active_run_id()
+        if run_id != self._pending_run_id:
+            self._submit_pending()
+            self._pending_run_id = run_id
+        return run_id
+
+    def flush(self, wait: bool = False):
+        """
+        Hand buffered metrics, params and tags to the background logger
+
+        Args:
+            wait: Block until everything logged so far has reached the tracking server
+
+        Raises:
+            Exception: The first background log_batch failure not yet raised by
+                its run's context manager or an earlier flush()
+        """
+        self._submit_pending()
+
+        if wait:
+            self._worker.join()
+
+        error = self._worker.pop_error()
+        if error is not None:
+            raise error
+
+    def _drain(self):
+        """Send everything logged so far, leaving send failures for their run's exit or flush()"""
+        self._submit_pending()
+        self._worker.join()
+
+    def _submit_pending(self):
+        """Hand the buffered entities to the background logger"""
+        with self._lock:
+            metrics = self._pending_metrics
+            params = self._pending_params
+            tags = self._pending_tags
+            if metrics or params or tags:
+                self._pending_metrics = []
+                self._pending_params = {}
+                self._pending_tags = {}
+                self._worker.submit(
+                    self._pending_run_id,
+                    metrics,
+                    list(params.values()),
+                    list(tags.values())
+                )
+
+    def _close_params(self):
+        """
+        Submit the buffer if it holds params, before metrics or tags are added
+
+        A buffered batch is sent as its metrics and tags, then its params, so
+        entities logged after params start a new batch to keep that order.
+        """
+        if self._pending_params:
+            self._submit_pending()
+
+    def _flush_and_join(self):
+        """Send everything still buffered or queued (called by the atexit hook)"""
+        try:
+            self.flush(wait=True)
+        except Exception as e:
+            print(f"MLflow logging failed: {e}")
 
     def log_params(self, params: Dict[str, Any]):
         """Log parameters to current run"""
-        mlflow.log_params(params)
+        with self._lock:
+            self._buffer_run_id()
+            pending = self._pending_params
+            for key, value in params.items():
+                value = str(value)
+                if key in pending and pending[key].value != value:
+                    # Let the server reject the overwrite as it would unbuffered
+                    self._submit_pending()
+                    pending = self._pending_params
+                pending[key] = Param(key, value)
+
+            if len(pending) >= MAX_PARAMS_TAGS_PER_BATCH:
+                self._submit_pending()
+
+    def set_tags(self, tags: Dict[str, Any]):
+        """Set tags on current run"""
+        with self._lock:
+            self._buffer_run_id()
+            self._close_params()
+            pending = self._pending_tags
+            for key, value in tags.items():
+                pending[key] = RunTag(key, str(value))
+
+            if len(pending) >= MAX_PARAMS_TAGS_PER_BATCH:
+                self._submit_pending()
 
     def log_metrics(
         self,
@@ -84,11 +568,29 @@ class MLflowManager:
             metrics: Dictionary of metric names and values
             step: Optional step number (for training curves)
         """
-        mlflow.log_metrics(metrics, step=step)
+        # Values are copied into Metric entities now; callers may reuse the dict
+        timestamp = int(time.time() * 1000)
+        step = step or 0
+        with self._lock:
+            self._buffer_run_id()
+            self._close_params()
+            self._pending_metrics.extend(
+                Metric(key, value, timestamp, step) for key, value in metrics.items()
+            )
+
+            if len(self._pending_metrics) >= MAX_METRICS_PER_BATCH:
+                self._submit_pending()
 
     def log_metric(self, key: str, value: float, step: Optional[int] = None):
         """Log a single metric"""
-        mlflow.log_metric(key, value, step=step)
+        metric = Metric(key, value, int(time.time() * 1000), step or 0)
+        with self._lock:
+            self._buffer_run_id()
+            self._close_params()
+            self._pending_metrics.append(metric)
+
+            if len(self._pending_metrics) >= MAX_METRICS_PER_BATCH:
+                self._submit_pending()
 
     def log_artifact(self, file_path: str, artifact_path: Optional[str] = None):
         """
@@ -98,7 +600,7 @@ class MLflowManager:
             file_path: Path to file to log
             artifact_path: Optional subdirectory in artifact store
         """
-        mlflow.log_artifact(file_path, artifact_path=artifact_path)
+        self.client.log_artifact(self._active_run_id(), file_path, artifact_path=artifact_path)
 
     def log_artifacts(self, dir_path: str, artifact_path: Optional[str] = None):
         """
@@ -108,7 +610,7 @@ class MLflowManager:
             dir_path: Directory containing files to log
             artifact_path: Optional subdirectory in artifact store
         """
-        mlflow.log_artifacts(dir_path, artifact_path=artifact_path)
+        self.client.log_artifacts(self._active_run_id(), dir_path, artifact_path=artifact_path)
 
     def log_model(
         self,
@@ -124,47 +626,64 @@ class MLflowManager:
             artifact_path: Path within artifacts to store model
             **kwargs: Additional arguments (signature, input_example, etc.)
         """
-        # Detect model type and use appropriate logging function
-        model_type = type(model).__name__
-
-        if 'sklearn' in str(type(model).__module__):
-            mlflow.sklearn.log_model(model, artifact_path, **kwargs)
-        elif 'xgboost' in str(type(model).__module__):
-            mlflow.xgboost.log_model(model, artifact_path, **kwargs)
-        elif 'lightgbm' in str(type(model).__module__):
-            mlflow.lightgbm.log_model(model, **kwargs)
-        elif 'torch' in str(type(model).__module__):
-            mlflow.pytorch.log_model(model, artifact_path, **kwargs)
-        else:
+        # Detect model type (resolved once per class) and use the matching flavour
+        flavour = _model_flavour(type(model))
+
+        if flavour is None:
             # Fallback to generic Python model
             mlflow.pyfunc.log_model(artifact_path, python_model=model, **kwargs)
+        else:
+            # Flavour modules are looked up lazily so unused ones are never imported
+            getattr(mlflow, flavour).log_model(model, artifact_path, **kwargs)
 
     def get_run(self, run_id: str) -> mlflow.entities.Run:
         """Get run by ID"""
+        self._drain()
         return self.client.get_run(run_id)
 
     def get_best_run(
         self,
         metric: str,
         mode: str = 'max',
-        filter_string: str = ""
+        filter_string: str = "",
+        status: Optional[str] = None,
+        tags: Optional[Dict[str, str]] = None,
+        min_metric: Optional[Tuple[str, float]] = None
     ) -> Optional[mlflow.entities.Run]:
         """
         Get the best run based on a metric
 
+        The typed filters are added to filter_string so the tracking server
+        does the filtering instead of the caller fetching runs to discard.
+
         Args:
             metric: Metric name to optimize
             mode: 'max' or 'min'
             filter_string: Optional filter query
+            status: Only consider runs with this status (e.g. 'FINISHED')
+            tags: Only consider runs with these exact tag values
+            min_metric: (metric name, value) - only consider runs where the metric exceeds value
 
         Returns:
             Best run, or None if no runs found
         """
         order_by = [f"metrics.{metric} {'DESC' if mode == 'max' else 'ASC'}"]
 
+        clauses = [filter_string] if filter_string else []
+        if status:
+            clauses.append(f"attributes.status = {_quote_filter_value(status)}")
+        for key, value in (tags or {}).items():
+            clauses.append(f"tags.`{key}` = {_quote_filter_value(value)}")
+        if min_metric is not None:
+            name, value = min_metric
+            clauses.append(f"metrics.`{name}` > {float(value)!r}")
+
+        self._drain()
+
         runs = self.client.search_runs(
-            experiment_ids=[self.experiment.experiment_id],
-            filter_string=filter_string,
+            experiment_ids=[self.experiment_id],
+            filter_string=" and ".join(clauses),
+            run_view_type=ViewType.ACTIVE_ONLY,
             order_by=order_by,
             max_results=1
         )
@@ -174,25 +693,73 @@ class MLflowManager:
     def get_all_runs(
         self,
         filter_string: str = "",
-        max_results: int = 1000
-    ) -> List[mlflow.entities.Run]:
+        max_results: int = 1000,
+        as_dataframe: bool = False
+    ) -> Union[List[mlflow.entities.Run], pd.DataFrame]:
         """
         Get all runs for the current experiment
 
         Args:
             filter_string: Optional filter query
             max_results: Maximum number of runs to return
+            as_dataframe: Return a DataFrame (one row per run, with status and
+                metrics.*/params.*/tags.* columns) instead of Run objects
 
         Returns:
-            List of runs
+            List of runs, or a DataFrame if as_dataframe is set
         """
+        self._drain()
+        if as_dataframe:
+            return mlflow.search_runs(
+                experiment_ids=[self.experiment_id],
+                filter_string=filter_string,
+                order_by=["start_time DESC"],
+                max_results=max_results,
+                output_format='pandas'
+            )
+
         return self.client.search_runs(
-            experiment_ids=[self.experiment.experiment_id],
+            experiment_ids=[self.experiment_id],
             filter_string=filter_string,
             order_by=["start_time DESC"],
             max_results=max_results
         )
 
+    def iter_runs(
+        self,
+        filter_string: str = "",
+        page_size: int = 500
+    ) -> Iterator[mlflow.entities.Run]:
+        """
+        Iterate over all runs for the current experiment, one page at a time
+
+        Only one page of runs is held in memory, and stopping early skips
+        the remaining requests.
+
+        Args:
+            filter_string: Optional filter query
+            page_size: Number of runs fetched per request
+
+        Yields:
+            Runs, newest first
+        """
+        self._drain()
+
+        page_token = None
+        while True:
+            page = self.client.search_runs(
+                experiment_ids=[self.experiment_id],
+                filter_string=filter_string,
+                order_by=["start_time DESC"],
+                max_results=page_size,
+                page_token=page_token
+            )
+            yield from page
+
+            page_token = page.token
+            if not page_token:
+                break
+
     def compare_runs(
         self,
         run_ids: List[str],
@@ -210,9 +777,15 @@ class MLflowManager:
         """
         comparison = {}
 
-        for run_id in run_ids:
-            run = self.get_run(run_id)
+        # Fetch the runs concurrently so N lookups cost about one round trip
+        self._drain()
+        if len(run_ids) < 2:
+            runs = [self.client.get_run(run_id) for run_id in run_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(run_ids))) as executor:
+                runs = list(executor.map(self.client.get_run, run_ids))
 
+        for run_id, run in zip(run_ids, runs):
             run_data = {
                 'run_name': run.data.tags.get('mlflow.runName', 'unnamed'),
                 'start_time': run.info.start_time,
@@ -274,37 +847,46 @@ class MLflowManager:
         Returns:
             Dictionary with experiment statistics
         """
-        runs = self.get_all_runs()
-
-        if not runs:
+        total_runs = 0
+        finished_runs = 0
+        failed_runs = 0
+        best_values: Dict[str, float] = {}
+
+        # Single streaming pass; metrics are tracked in order of first appearance
+        for run in self.iter_runs():
+            total_runs += 1
+            status = run.info.status
+            if status == 'FINISHED':
+                finished_runs += 1
+            elif status == 'FAILED':
+                failed_runs += 1
+
+            for metric, value in run.data.metrics.items():
+                best = best_values.get(metric)
+                # NaN never wins, matching DataFrame.max()
+                if best is None or value > best or best != best:
+                    best_values[metric] = value
+
+        if not total_runs:
             return {
                 'total_runs': 0,
                 'status': 'No runs yet'
             }
 
-        # Calculate statistics
-        total_runs = len(runs)
-        finished_runs = sum(1 for r in runs if r.info.status == 'FINISHED')
-        failed_runs = sum(1 for r in runs if r.info.status == 'FAILED')
-
-        # Get common metrics across runs
-        all_metrics = set()
-        for run in runs:
-            all_metrics.update(run.data.metrics.keys())
+        all_metrics = list(best_values)
 
         # Get best values for each metric
-        best_metrics = {}
-        for metric in all_metrics:
-            values = [r.data.metrics.get(metric) for r in runs if metric in r.data.metrics]
-            if values:
-                best_metrics[f"best_{metric}"] = max(values)
+        best_metrics = {
+            f"best_{metric}": float(value)
+            for metric, value in best_values.items()
+        }
 
         return {
             'total_runs': total_runs,
             'finished_runs': finished_runs,
             'failed_runs': failed_runs,
             'running_runs': total_runs - finished_runs - failed_runs,
-            'metrics_tracked': list(all_metrics),
+            'metrics_tracked': all_metrics,
             'best_metrics': best_metrics
         }
 
@@ -312,5 +894,10 @@ class MLflowManager:
         return f"MLflowManager(experiment={self.experiment_name}, uri={self.tracking_uri})"
 
 
-# Global instance
-mlflow_manager = MLflowManager()
+def __getattr__(name: str) -> Any:
+    """Construct the global instance on first access"""
+    if name == 'mlflow_manager':
+        instance = MLflowManager()
+        globals()['mlflow_manager'] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
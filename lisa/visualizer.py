@@ -4,12 +4,17 @@ LISA Visualization Module
 Generates model-specific visualizations for different types of ML models.
 """
 
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.figure import Figure
+from PIL import features as pil_features
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Tuple, Union
 import warnings
 
 warnings.filterwarnings('ignore')
@@ -18,20 +23,146 @@ warnings.filterwarnings('ignore')
 sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (10, 6)
 plt.rcParams['font.size'] = 10
+# Above this many points scatter plots are drawn as hexbin density plots
+SCATTER_MAX_POINTS = 20000
+
+# WebP needs a Pillow build with libwebp; without it plots are written as PNG
+HAS_WEBP = pil_features.check('webp')
+
+# Fastest encoder settings per format; lossless keeps plot lines and text sharp
+_SAVE_PIL_KWARGS = {
+    'png': {'compress_level': 1},
+    'webp': {'lossless': True, 'method': 0},
+}
+
+def _ovr_counts(
+    y_true: np.ndarray,
+    y_pred_proba: np.ndarray,
+    classes: Optional[np.ndarray] = None
+):
+    """
+    One-vs-rest false/true positive counts at each distinct score threshold
+
+    Same counts as sklearn's roc_curve/precision_recall_curve compute per class,
+    but every class column shares one stable descending sort and cumsum.
+    Binary problems give one curve, for the positive (larger) class.
+    classes is np.unique(y_true), if the caller already has it.
+
+    Returns:
+        Tuple of (classes, list of (fps, tps) per curve)
+    """
+    y_true = np.asarray(y_true)
+    y_pred_proba = np.asarray(y_pred_proba)
+    if classes is None:
+        classes = np.unique(y_true)
+
+    if len(classes) == 2:
+        y_bin = (y_true == classes[1])[:, None]
+        scores = y_pred_proba[:, 1:2]
+    else:
+        y_bin = y_true[:, None] == classes
+        scores = y_pred_proba[:, :len(classes)]
+
+    order = np.argsort(scores, axis=0, kind='mergesort')[::-1]
+    sorted_scores = np.take_along_axis(scores, order, axis=0)
+    tps_all = np.cumsum(np.take_along_axis(y_bin.astype(np.float64), order, axis=0), axis=0)
+
+    last = len(y_true) - 1
+    curves = []
+    for j in range(scores.shape[1]):
+        threshold_idx = np.r_[np.flatnonzero(np.diff(sorted_scores[:, j])), last]
+        tps = tps_all[threshold_idx, j]
+        curves.append((1 + threshold_idx - tps, tps))
+
+    return classes, curves
+
+
+def _roc_from_counts(fps: np.ndarray, tps: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """FPR and TPR from threshold counts (sklearn's roc_curve with drop_intermediate)"""
+    if len(fps) > 2:
+        keep = np.flatnonzero(np.r_[True, np.logical_or(np.diff(fps, 2), np.diff(tps, 2)), True])
+        fps, tps = fps[keep], tps[keep]
+
+    fps = np.r_[0, fps]
+    tps = np.r_[0, tps]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return fps / fps[-1], tps / tps[-1]
+
+
+def _pr_from_counts(fps: np.ndarray, tps: np.ndarray) -> Tuple[np.ndarray, np.ndarray, float]:
+    """Precision, recall and average precision from threshold counts (as in sklearn)"""
+    predicted = tps + fps
+    precision = np.zeros_like(tps)
+    np.divide(tps, predicted, out=precision, where=(predicted != 0))
+    recall = np.ones_like(tps) if tps[-1] == 0 else tps / tps[-1]
+
+    precision = np.r_[precision[::-1], 1]
+    recall = np.r_[recall[::-1], 0]
+    ap = float(-np.sum(np.diff(recall) * precision[:-1]))
+    return precision, recall, ap
+
+
+def _render_plot_task(
+    task: Tuple[type, Dict[str, Any], str, tuple, Dict[str, Any]]
+) -> Path:
+    """Run one (class, init kwargs, method name, args, kwargs) plot task in a worker process"""
+    cls, init_kwargs, method_name, args, kwargs = task
+    return getattr(cls(**init_kwargs), method_name)(*args, **kwargs)
 
 
 class Visualizer:
     """Generate visualizations for ML models and data"""
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, dpi: int = 100, fmt: str = 'png'):
         """
         Initialize visualizer
 
         Args:
             output_dir: Directory to save visualizations
+            dpi: Resolution of the saved images
+            fmt: Image format, 'png' or 'webp' (PNG is used if Pillow lacks WebP support)
         """
+        if fmt not in _SAVE_PIL_KWARGS:
+            raise ValueError(f"Unsupported image format: {fmt} (expected one of {list(_SAVE_PIL_KWARGS)})")
+
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.dpi = dpi
+        self.fmt = fmt if fmt != 'webp' or HAS_WEBP else 'png'
+
+        # One reusable figure per size. Figures are built without pyplot, so they
+        # render straight to Agg and never touch the interactive backend
+        self._fig_cache: Dict[Tuple[float, float], Figure] = {}
+
+    def _subplots(self, figsize: Tuple[float, float], ncols: int = 1):
+        """Cleared figure of the given size and its axes (like plt.subplots)"""
+        fig = self._fig_cache.get(figsize)
+        if fig is None:
+            fig = self._fig_cache[figsize] = Figure(figsize=figsize)
+        else:
+            fig.clear()
+        return fig, fig.subplots(1, ncols)
+
+    @staticmethod
+    def _scatter(fig: Figure, ax, x: np.ndarray, y: np.ndarray):
+        """Scatter plot, binned into hexagons when there are too many points to draw"""
+        if len(x) > SCATTER_MAX_POINTS:
+            hb = ax.hexbin(x, y, gridsize=80, cmap='viridis', mincnt=1)
+            fig.colorbar(hb, ax=ax, label='Count')
+        else:
+            ax.scatter(x, y, alpha=0.5, edgecolors='k')
+
+    def _save(self, fig: Figure, output_path: Path) -> Path:
+        """Lay out and write a figure, returning the path written"""
+        output_path = Path(output_path)
+        if self.fmt != 'png' and output_path.suffix.lower() == '.png':
+            output_path = output_path.with_suffix(f'.{self.fmt}')
+
+        # tight_layout already fits the labels; bbox_inches='tight' would render twice
+        fig.tight_layout()
+        fig.savefig(output_path, dpi=self.dpi, format=self.fmt, pil_kwargs=_SAVE_PIL_KWARGS[self.fmt])
+
+        return output_path
 
     def generate_visualizations(
         self,
@@ -42,7 +173,8 @@ class Visualizer:
         y_pred_proba: Optional[np.ndarray] = None,
         feature_names: Optional[List[str]] = None,
         feature_importance: Optional[Dict[str, float]] = None,
-        experiment_id: Optional[str] = None
+        experiment_id: Optional[str] = None,
+        parallel: bool = False
     ) -> List[Path]:
         """
         Generate all relevant visualizations for a model
@@ -56,92 +188,123 @@ class Visualizer:
             feature_names: List of feature names
             feature_importance: Dictionary of feature importances
             experiment_id: Optional experiment identifier
+            parallel: Render the plots in worker processes when several cores are
+                available. The workers are started fresh and import LISA again, so
+                this only pays off for large inputs
 
         Returns:
             List of paths to generated visualization files
         """
-        plots = []
+        tasks = []
         prefix = f"{experiment_id}_" if experiment_id else ""
 
+        def add(method_name: str, *args, filename: str, **kwargs):
+            kwargs['output_path'] = self.output_dir / f"{prefix}{filename}"
+            tasks.append((method_name, args, kwargs))
+
         if task_type == 'classification':
+            # Class labels and counts shared by the plots below, so each sort runs once
+            true_counts = np.unique(y_true, return_counts=True)
+            pred_counts = np.unique(y_pred, return_counts=True)
+            classes = true_counts[0]
+
             # Confusion matrix
-            cm_path = self.plot_confusion_matrix(
-                y_true, y_pred,
-                output_path=self.output_dir / f"{prefix}confusion_matrix.png"
-            )
-            plots.append(cm_path)
+            add('plot_confusion_matrix', y_true, y_pred, filename="confusion_matrix.png",
+                _classes=classes, _pred_classes=pred_counts[0])
 
             # ROC curves (if probabilities available)
             if y_pred_proba is not None:
-                roc_path = self.plot_roc_curves(
-                    y_true, y_pred_proba,
-                    output_path=self.output_dir / f"{prefix}roc_curves.png"
-                )
-                plots.append(roc_path)
+                add('plot_roc_curves', y_true, y_pred_proba, filename="roc_curves.png",
+                    _classes=classes)
 
                 # Precision-Recall curves
-                pr_path = self.plot_precision_recall_curves(
-                    y_true, y_pred_proba,
-                    output_path=self.output_dir / f"{prefix}precision_recall.png"
-                )
-                plots.append(pr_path)
+                add('plot_precision_recall_curves', y_true, y_pred_proba, filename="precision_recall.png",
+                    _classes=classes)
 
             # Class distribution
-            dist_path = self.plot_class_distribution(
-                y_true, y_pred,
-                output_path=self.output_dir / f"{prefix}class_distribution.png"
-            )
-            plots.append(dist_path)
+            add('plot_class_distribution', y_true, y_pred, filename="class_distribution.png",
+                _class_counts=(true_counts, pred_counts))
 
         elif task_type == 'regression':
+            residuals = y_true - y_pred
+
             # Actual vs Predicted
-            scatter_path = self.plot_actual_vs_predicted(
-                y_true, y_pred,
-                output_path=self.output_dir / f"{prefix}actual_vs_predicted.png"
-            )
-            plots.append(scatter_path)
+            add('plot_actual_vs_predicted', y_true, y_pred, filename="actual_vs_predicted.png")
 
             # Residual plot
-            residual_path = self.plot_residuals(
-                y_true, y_pred,
-                output_path=self.output_dir / f"{prefix}residuals.png"
-            )
-            plots.append(residual_path)
+            add('plot_residuals', y_true, y_pred, filename="residuals.png", _residuals=residuals)
 
             # Residual distribution
-            residual_dist_path = self.plot_residual_distribution(
-                y_true, y_pred,
-                output_path=self.output_dir / f"{prefix}residual_distribution.png"
-            )
-            plots.append(residual_dist_path)
+            add('plot_residual_distribution', y_true, y_pred, filename="residual_distribution.png",
+                _residuals=residuals)
 
         # Feature importance (if available)
         if feature_importance:
-            fi_path = self.plot_feature_importance(
-                feature_importance,
-                output_path=self.output_dir / f"{prefix}feature_importance.png"
-            )
-            plots.append(fi_path)
+            add('plot_feature_importance', feature_importance, filename="feature_importance.png")
 
-        return plots
+        return self._run_plot_tasks(tasks, parallel)
+
+    def _run_plot_tasks(
+        self,
+        tasks: List[Tuple[str, tuple, Dict[str, Any]]],
+        parallel: bool
+    ) -> List[Path]:
+        """Render (method name, args, kwargs) plot tasks, in worker processes if requested"""
+        n_workers = min(len(tasks), os.cpu_count() or 1)
+        if not parallel or n_workers < 2:
+            return [getattr(self, name)(*args, **kwargs) for name, args, kwargs in tasks]
+
+        # Forking a process that may already run BLAS or matplotlib threads can
+        # deadlock the children, so workers come from a clean forkserver/spawn
+        # process and receive each task pickled as an argument
+        start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+        init_kwargs = {'output_dir': self.output_dir, 'dpi': self.dpi, 'fmt': self.fmt}
+        payloads = [(type(self), init_kwargs, name, args, kwargs) for name, args, kwargs in tasks]
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            mp_context=multiprocessing.get_context(start_method)
+        ) as executor:
+            return list(executor.map(_render_plot_task, payloads))
 
     def plot_confusion_matrix(
         self,
         y_true: np.ndarray,
         y_pred: np.ndarray,
         labels: Optional[List[str]] = None,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        _classes: Optional[np.ndarray] = None,
+        _pred_classes: Optional[np.ndarray] = None
     ) -> Path:
         """Plot confusion matrix"""
-        from sklearn.metrics import confusion_matrix
+        if _classes is None:
+            _classes = np.unique(y_true)
+
+        y_true_arr = np.asarray(y_true)
+        y_pred_arr = np.asarray(y_pred)
+
+        if (np.issubdtype(y_true_arr.dtype, np.integer)
+                and np.issubdtype(y_pred_arr.dtype, np.integer)):
+            # Same matrix as sklearn's confusion_matrix (rows/columns over the sorted
+            # union of labels), counted in one bincount pass
+            y_true_arr = y_true_arr.ravel()
+            y_pred_arr = y_pred_arr.ravel()
+            if _pred_classes is None:
+                classes = np.unique(np.concatenate([_classes, y_pred_arr]))
+            else:
+                classes = np.union1d(_classes, _pred_classes)
+            k = len(classes)
+            codes = k * np.searchsorted(classes, y_true_arr) + np.searchsorted(classes, y_pred_arr)
+            cm = np.bincount(codes, minlength=k * k).reshape(k, k)
+        else:
+            from sklearn.metrics import confusion_matrix
 
-        cm = confusion_matrix(y_true, y_pred)
+            cm = confusion_matrix(y_true, y_pred)
 
-        fig, ax = plt.subplots(figsize=(8, 6))
+        fig, ax = self._subplots((8, 6))
         sns.heatmap(
             cm, annot=True, fmt='d', cmap='Blues',
-            xticklabels=labels or np.unique(y_true),
-            yticklabels=labels or np.unique(y_true),
+            xticklabels=labels or _classes,
+            yticklabels=labels or _classes,
             ax=ax
         )
         ax.set_xlabel('Predicted')
@@ -151,41 +314,34 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "confusion_matrix.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_roc_curves(
         self,
         y_true: np.ndarray,
         y_pred_proba: np.ndarray,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        _classes: Optional[np.ndarray] = None
     ) -> Path:
         """Plot ROC curves for each class"""
-        from sklearn.metrics import roc_curve, auc
-        from sklearn.preprocessing import label_binarize
+        from sklearn.metrics import auc
 
-        # Get unique classes
-        classes = np.unique(y_true)
-        n_classes = len(classes)
+        # Threshold counts for every class from one batched sort
+        classes, curves = _ovr_counts(y_true, y_pred_proba, _classes)
 
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._subplots((10, 8))
 
         # Binary classification
-        if n_classes == 2:
-            fpr, tpr, _ = roc_curve(y_true, y_pred_proba[:, 1])
+        if len(classes) == 2:
+            fpr, tpr = _roc_from_counts(*curves[0])
             roc_auc = auc(fpr, tpr)
 
             ax.plot(fpr, tpr, lw=2, label=f'ROC curve (AUC = {roc_auc:.3f})')
 
         # Multi-class
         else:
-            y_true_bin = label_binarize(y_true, classes=classes)
-
-            for i, class_label in enumerate(classes):
-                fpr, tpr, _ = roc_curve(y_true_bin[:, i], y_pred_proba[:, i])
+            for class_label, counts in zip(classes, curves):
+                fpr, tpr = _roc_from_counts(*counts)
                 roc_auc = auc(fpr, tpr)
 
                 ax.plot(fpr, tpr, lw=2, label=f'Class {class_label} (AUC = {roc_auc:.3f})')
@@ -202,39 +358,28 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "roc_curves.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_precision_recall_curves(
         self,
         y_true: np.ndarray,
         y_pred_proba: np.ndarray,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        _classes: Optional[np.ndarray] = None
     ) -> Path:
         """Plot Precision-Recall curves"""
-        from sklearn.metrics import precision_recall_curve, average_precision_score
-        from sklearn.preprocessing import label_binarize
+        classes, curves = _ovr_counts(y_true, y_pred_proba, _classes)
 
-        classes = np.unique(y_true)
-        n_classes = len(classes)
-
-        fig, ax = plt.subplots(figsize=(10, 8))
+        fig, ax = self._subplots((10, 8))
 
-        if n_classes == 2:
-            precision, recall, _ = precision_recall_curve(y_true, y_pred_proba[:, 1])
-            ap = average_precision_score(y_true, y_pred_proba[:, 1])
+        if len(classes) == 2:
+            precision, recall, ap = _pr_from_counts(*curves[0])
 
             ax.plot(recall, precision, lw=2, label=f'AP = {ap:.3f}')
 
         else:
-            y_true_bin = label_binarize(y_true, classes=classes)
-
-            for i, class_label in enumerate(classes):
-                precision, recall, _ = precision_recall_curve(y_true_bin[:, i], y_pred_proba[:, i])
-                ap = average_precision_score(y_true_bin[:, i], y_pred_proba[:, i])
+            for class_label, counts in zip(classes, curves):
+                precision, recall, ap = _pr_from_counts(*counts)
 
                 ax.plot(recall, precision, lw=2, label=f'Class {class_label} (AP = {ap:.3f})')
 
@@ -247,23 +392,24 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "precision_recall.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_class_distribution(
         self,
         y_true: np.ndarray,
         y_pred: np.ndarray,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        _class_counts: Optional[Tuple[Tuple[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]]] = None
     ) -> Path:
         """Plot class distribution comparison"""
-        fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+        if _class_counts is None:
+            _class_counts = (np.unique(y_true, return_counts=True),
+                             np.unique(y_pred, return_counts=True))
+
+        fig, axes = self._subplots((14, 5), ncols=2)
 
         # True distribution
-        unique, counts = np.unique(y_true, return_counts=True)
+        unique, counts = _class_counts[0]
         axes[0].bar(unique, counts, color='skyblue', edgecolor='black')
         axes[0].set_xlabel('Class')
         axes[0].set_ylabel('Count')
@@ -271,7 +417,7 @@ class Visualizer:
         axes[0].grid(True, alpha=0.3, axis='y')
 
         # Predicted distribution
-        unique_pred, counts_pred = np.unique(y_pred, return_counts=True)
+        unique_pred, counts_pred = _class_counts[1]
         axes[1].bar(unique_pred, counts_pred, color='lightcoral', edgecolor='black')
         axes[1].set_xlabel('Class')
         axes[1].set_ylabel('Count')
@@ -281,11 +427,7 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "class_distribution.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_actual_vs_predicted(
         self,
@@ -294,9 +436,9 @@ class Visualizer:
         output_path: Optional[Path] = None
     ) -> Path:
         """Plot actual vs predicted scatter plot for regression"""
-        fig, ax = plt.subplots(figsize=(8, 8))
+        fig, ax = self._subplots((8, 8))
 
-        ax.scatter(y_true, y_pred, alpha=0.5, edgecolors='k')
+        self._scatter(fig, ax, y_true, y_pred)
 
         # Perfect prediction line
         min_val = min(y_true.min(), y_pred.min())
@@ -312,24 +454,21 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "actual_vs_predicted.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_residuals(
         self,
         y_true: np.ndarray,
         y_pred: np.ndarray,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        _residuals: Optional[np.ndarray] = None
     ) -> Path:
         """Plot residual plot"""
-        residuals = y_true - y_pred
+        residuals = y_true - y_pred if _residuals is None else _residuals
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._subplots((10, 6))
 
-        ax.scatter(y_pred, residuals, alpha=0.5, edgecolors='k')
+        self._scatter(fig, ax, y_pred, residuals)
         ax.axhline(y=0, color='r', linestyle='--', lw=2)
 
         ax.set_xlabel('Predicted Values')
@@ -340,24 +479,23 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "residuals.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_residual_distribution(
         self,
         y_true: np.ndarray,
         y_pred: np.ndarray,
-        output_path: Optional[Path] = None
+        output_path: Optional[Path] = None,
+        _residuals: Optional[np.ndarray] = None
     ) -> Path:
         """Plot residual distribution"""
-        residuals = y_true - y_pred
+        residuals = y_true - y_pred if _residuals is None else _residuals
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = self._subplots((10, 6))
 
-        ax.hist(residuals, bins=50, edgecolor='black', alpha=0.7)
+        # One filled step artist instead of 50 bar patches
+        counts, edges = np.histogram(residuals, bins=50)
+        ax.stairs(counts, edges, fill=True, alpha=0.7, edgecolor='black')
         ax.axvline(x=0, color='r', linestyle='--', lw=2, label='Zero Residual')
 
         ax.set_xlabel('Residuals')
@@ -369,11 +507,7 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "residual_distribution.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_feature_importance(
         self,
@@ -382,16 +516,26 @@ class Visualizer:
         output_path: Optional[Path] = None
     ) -> Path:
         """Plot feature importance"""
-        # Sort by importance
-        sorted_features = sorted(
-            feature_importance.items(),
-            key=lambda x: abs(x[1]),
-            reverse=True
-        )[:top_n]
+        names = list(feature_importance)
+        values = np.fromiter(feature_importance.values(), dtype=np.float64, count=len(names))
+        # NaN importances rank below every real one instead of poisoning the cutoff
+        magnitudes = np.nan_to_num(np.abs(values), nan=-np.inf)
+
+        # Top features by |importance|: linear-time partial selection instead of a
+        # full sort, with ties kept in insertion order (as a stable sort would)
+        if len(names) > top_n:
+            kth = np.partition(magnitudes, -top_n)[-top_n]
+            above = np.flatnonzero(magnitudes > kth)
+            ties = np.flatnonzero(magnitudes == kth)[:top_n - len(above)]
+            selected = np.sort(np.concatenate([above, ties]))
+        else:
+            selected = np.arange(len(names))
+        selected = selected[np.argsort(-magnitudes[selected], kind='stable')]
 
-        features, importances = zip(*sorted_features)
+        features = [names[i] for i in selected]
+        importances = values[selected]
 
-        fig, ax = plt.subplots(figsize=(10, max(6, len(features) * 0.3)))
+        fig, ax = self._subplots((10, max(6, len(features) * 0.3)))
 
         y_pos = np.arange(len(features))
         ax.barh(y_pos, importances, color='skyblue', edgecolor='black')
@@ -405,11 +549,7 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "feature_importance.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def plot_correlation_heatmap(
         self,
@@ -425,10 +565,24 @@ class Visualizer:
         if len(numeric_df.columns) > max_features:
             numeric_df = numeric_df.iloc[:, :max_features]
 
-        # Compute correlation matrix
-        corr = numeric_df.corr()
+        # Compute correlation matrix; without missing values a single corrcoef call
+        # over the float64 values matches pandas' pairwise-complete corr(). The data
+        # stays in float64 because columns with a large offset and a small spread
+        # (e.g. epoch timestamps) lose their variance when cast to float32
+        values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        if np.isnan(values).any():
+            corr = numeric_df.corr()
+        else:
+            # Constant columns give NaN, as they do in pandas
+            with np.errstate(divide='ignore', invalid='ignore'):
+                corr_values = np.corrcoef(values, rowvar=False)
+            corr = pd.DataFrame(
+                np.atleast_2d(corr_values),
+                index=numeric_df.columns,
+                columns=numeric_df.columns
+            )
 
-        fig, ax = plt.subplots(figsize=(12, 10))
+        fig, ax = self._subplots((12, 10))
         sns.heatmap(
             corr, annot=True, fmt='.2f', cmap='coolwarm',
             center=0, square=True, ax=ax,
@@ -439,11 +593,7 @@ class Visualizer:
         if output_path is None:
             output_path = self.output_dir / "correlation_heatmap.png"
 
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=150, bbox_inches='tight')
-        plt.close()
-
-        return output_path
+        return self._save(fig, output_path)
 
     def __repr__(self) -> str:
-        return f"Visualizer(output_dir={self.output_dir})"
+        return f"Visualizer(output_dir={self.output_dir}, dpi={self.dpi}, fmt={self.fmt})"
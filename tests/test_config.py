@@ -0,0 +1,56 @@
+"""
+Tests for lisa.config
+"""
+
+import pytest
+
+from lisa.config import Config, _DEFAULT_CONFIG
+
+
+@pytest.fixture
+def fresh_config(tmp_path, monkeypatch):
+    """A new Config singleton loaded in an empty directory (the previous one is restored afterwards)"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, '_instance', None)
+    monkeypatch.setattr(Config, '_initialized', False)
+    monkeypatch.setattr(Config, '_config_path_cache', None)
+    return Config()
+
+
+def test_default_config_is_not_shared_between_loads(fresh_config, tmp_path):
+    assert fresh_config.get('project.name') == 'lisa-ml-project'
+
+    fresh_config.get_stopping_criteria()['performance']['threshold'] = 0.5
+    fresh_config.get('data_science')['random_seed'] = 7
+    fresh_config.load_config(str(tmp_path / 'missing.yaml'))
+
+    assert fresh_config.get('stopping_criteria.performance.threshold') == 0.90
+    assert fresh_config.get('data_science.random_seed') == 42
+    assert _DEFAULT_CONFIG['stopping_criteria']['performance']['threshold'] == 0.90
+
+
+def test_failed_load_is_retried(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, '_instance', None)
+    monkeypatch.setattr(Config, '_config_path_cache', None)
+    config_file = tmp_path / 'lisa_config.yaml'
+    config_file.write_text('project: [unclosed\n')
+
+    with pytest.raises(Exception):
+        Config()
+
+    config_file.write_text('project:\n  name: retried\n')
+    assert Config().get('project.name') == 'retried'
+    assert Config().project_name == 'retried'
+
+
+def test_resetting_the_instance_loads_again(fresh_config, tmp_path):
+    assert fresh_config.project_name == 'lisa-ml-project'
+    (tmp_path / 'lisa_config.yaml').write_text('project:\n  name: reloaded\n')
+
+    Config._instance = None
+    config = Config()
+
+    assert config is not fresh_config
+    assert config.get('project.name') == 'reloaded'
+    assert config.project_name == 'reloaded'
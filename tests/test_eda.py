@@ -0,0 +1,200 @@
+"""
+Tests for lisa.core.eda
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from lisa.core import eda as eda_module
+from lisa.core.eda import EDA
+
+
+@pytest.fixture
+def eda(tmp_path):
+    return EDA(tmp_path)
+
+
+@pytest.mark.parametrize('method', ['iqr', 'zscore'])
+def test_detect_outliers_without_numeric_columns(eda, method):
+    df = pd.DataFrame({'color': ['red', 'blue', 'red'], 'size': ['S', 'M', 'L']})
+
+    result = eda.detect_outliers(df, method=method)
+
+    assert result['outliers_by_column'] == {}
+
+
+@pytest.mark.parametrize('method', ['iqr', 'zscore'])
+def test_detect_outliers_without_rows(eda, method):
+    df = pd.DataFrame({'x': pd.Series([], dtype=float), 'y': pd.Series([], dtype=int)})
+
+    result = eda.detect_outliers(df, method=method)
+
+    assert result['outliers_by_column'] == {}
+
+
+def test_eda_report_on_categorical_dataset(eda):
+    df = pd.DataFrame({'color': ['red', 'blue', 'green'] * 10, 'label': ['a', 'b'] * 15})
+
+    report = eda.generate_eda_report(df, name='categorical')
+
+    assert report['outliers']['outliers_by_column'] == {}
+
+
+def test_detect_outliers_iqr_matches_per_column_quantiles(eda):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({'a': rng.normal(size=200), 'b': rng.exponential(size=200)})
+    df.loc[::7, 'b'] = np.nan
+
+    result = eda.detect_outliers(df, method='iqr')
+
+    for col in df.columns:
+        series = df[col].dropna()
+        q1, q3 = series.quantile(0.25), series.quantile(0.75)
+        iqr = q3 - q1
+        expected = int(((series < q1 - 1.5 * iqr) | (series > q3 + 1.5 * iqr)).sum())
+        assert result['outliers_by_column'].get(col, {}).get('count', 0) == expected
+
+
+def _write_mixed_csv(path):
+    # Integers for longer than Polars' default 100-row inference window, then a float,
+    # and the missing-value spellings pandas recognises by default
+    rows = ['a,b,c,s'] + [f'{i},{i * 2},x{i},w' for i in range(300)]
+    rows += ['1.5,NA,,NA', '2,,y,', '3,7,N/A,null']
+    path.write_text('\n'.join(rows) + '\n')
+    return path
+
+
+def test_load_dataset_polars_matches_pandas(eda, tmp_path, monkeypatch):
+    pytest.importorskip('polars')
+    path = _write_mixed_csv(tmp_path / 'mixed.csv')
+
+    with_polars = eda.load_dataset(str(path))
+    monkeypatch.setattr(eda_module, 'HAS_POLARS', False)
+    with_pandas = eda.load_dataset(str(path))
+
+    pd.testing.assert_frame_equal(with_polars, with_pandas)
+    assert with_polars['a'].iloc[300] == 1.5
+    assert with_polars.isna().sum().to_dict() == {'a': 0, 'b': 2, 'c': 2, 's': 3}
+
+
+def test_load_dataset_falls_back_to_pandas_on_polars_parse_error(eda, tmp_path, monkeypatch):
+    pl = pytest.importorskip('polars')
+    path = _write_mixed_csv(tmp_path / 'mixed.csv')
+
+    def fail(*args, **kwargs):
+        raise pl.exceptions.ComputeError('could not parse')
+
+    monkeypatch.setattr(eda, '_load_with_polars', fail)
+    df = eda.load_dataset(str(path))
+
+    assert len(df) == 303
+    assert df['a'].iloc[300] == 1.5
+
+
+@pytest.mark.parametrize('loader', ['polars', 'pyarrow', 'c'])
+def test_load_dataset_parses_iso_dates_with_every_loader(eda, tmp_path, monkeypatch, loader):
+    if loader == 'polars':
+        pytest.importorskip('polars')
+    else:
+        monkeypatch.setattr(eda_module, 'HAS_POLARS', False)
+        if loader == 'pyarrow':
+            pytest.importorskip('pyarrow')
+        else:
+            monkeypatch.setattr(eda_module, 'HAS_PYARROW', False)
+
+    path = tmp_path / 'dates.csv'
+    path.write_text(
+        'day,stamp,utc,text\n'
+        '2024-01-01,2024-01-01 10:00:00,2024-01-01T10:00:00Z,2024-01-01\n'
+        '2024-02-03,2024-01-02 11:30:00.5,2024-01-01T11:00:00+02:00,hello\n'
+        ',,,\n'
+    )
+
+    df = eda.load_dataset(str(path))
+
+    assert str(df['day'].dtype) == 'datetime64[us]'
+    assert str(df['stamp'].dtype) == 'datetime64[us]'
+    assert str(df['utc'].dtype) == 'datetime64[us, UTC]'
+    assert df['utc'].iloc[1] == pd.Timestamp('2024-01-01T09:00:00Z')
+    assert not pd.api.types.is_datetime64_any_dtype(df['text'].dtype)
+
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman', 'kendall'])
+@pytest.mark.parametrize('with_nan', [False, True])
+def test_correlation_matrix_matches_pandas(eda, method, with_nan):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'a': rng.normal(size=50),
+        'b': rng.integers(0, 5, size=50).astype(float),
+        'c': rng.exponential(size=50),
+        'constant': np.ones(50),
+    })
+    df['d'] = df['a'] * 2 + rng.normal(scale=0.5, size=50)
+    if with_nan:
+        for col in ('a', 'b', 'd'):
+            df.loc[rng.choice(50, size=8, replace=False), col] = np.nan
+
+    result = eda._correlation_matrix(df, method)
+
+    pd.testing.assert_frame_equal(result, df.corr(method=method), rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('loader', ['polars', 'pandas'])
+@pytest.mark.parametrize('suffix', ['.csv', '.parquet'])
+def test_large_files_are_sampled_to_configured_rows(eda, tmp_path, monkeypatch, loader, suffix):
+    if loader == 'polars':
+        pytest.importorskip('polars')
+    else:
+        monkeypatch.setattr(eda_module, 'HAS_POLARS', False)
+    if suffix == '.parquet':
+        pytest.importorskip('pyarrow')
+
+    df = pd.DataFrame({'x': np.arange(5000), 'y': np.arange(5000) * 0.5})
+    path = tmp_path / f'large{suffix}'
+    if suffix == '.csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path)
+
+    monkeypatch.setattr(eda_module, 'LARGE_DATASET_MB', 0)
+    monkeypatch.setattr(eda_module.Config, 'get', lambda self, key, default=None: (
+        1000 if key == 'data_science.chunk_size_rows' else default
+    ))
+
+    assert len(eda.load_dataset(str(path))) == 1000
+    # True is not a row count; it falls back to the automatic sample as well
+    assert len(eda.load_dataset(str(path), sample_size=True)) == 1000
+    assert len(eda.load_dataset(str(path), sample_size=300)) == 300
+
+
+def test_profile_numeric_stats_match_per_series_pandas(eda):
+    rng = np.random.default_rng(0)
+    n = 200
+    floats = rng.normal(1e6, 3.0, n)
+    floats[::7] = np.nan
+    df = pd.DataFrame({
+        'small_int': rng.integers(-5, 5, n),
+        'big_int': rng.integers(0, 2**40, n),
+        'float': floats,
+        'all_nan': np.full(n, np.nan),
+        'label': rng.choice(['x', 'y'], n),
+    })
+
+    columns = eda.profile_dataset(df, n_jobs=1)['columns']
+
+    for col in ['small_int', 'big_int', 'float', 'all_nan']:
+        series = df[col]
+        empty = series.isna().all()
+        expected = {
+            'mean': series.mean(), 'std': series.std(), 'min': series.min(),
+            'max': series.max(), 'median': series.median(),
+            'q25': series.quantile(0.25), 'q75': series.quantile(0.75),
+        }
+        for stat, value in expected.items():
+            if empty:
+                assert columns[col][stat] is None
+            else:
+                assert columns[col][stat] == pytest.approx(float(value), rel=1e-12), (col, stat)
+        assert columns[col]['missing'] == int(series.isna().sum())
+        assert columns[col]['unique'] == series.nunique()
@@ -0,0 +1,237 @@
+"""
+Tests for lisa.mlflow_manager
+"""
+
+import functools
+import gc
+import importlib
+import json
+import time
+import types
+import weakref
+
+import pytest
+
+pytest.importorskip('mlflow')
+mlflow_manager = importlib.import_module('lisa.mlflow_manager')
+MLflowManager = mlflow_manager.MLflowManager
+MlflowException = mlflow_manager.MlflowException
+
+
+class FakeTrackingServer:
+    """Experiments by ID, standing in for the fluent mlflow experiment calls"""
+
+    def __init__(self, monkeypatch):
+        self.experiments = {}
+        self.calls = []
+        monkeypatch.setattr(mlflow_manager.mlflow, 'get_experiment', self.get_experiment)
+        monkeypatch.setattr(mlflow_manager.mlflow, 'get_experiment_by_name', self.get_experiment_by_name)
+        monkeypatch.setattr(mlflow_manager.mlflow, 'create_experiment', self.create_experiment, raising=False)
+
+    def create_experiment(self, name, tags=None):
+        experiment_id = str(len(self.experiments) + 1)
+        self.experiments[experiment_id] = types.SimpleNamespace(
+            experiment_id=experiment_id, name=name, lifecycle_stage='active'
+        )
+        return experiment_id
+
+    def get_experiment(self, experiment_id):
+        self.calls.append(('get', experiment_id))
+        return self.experiments.get(experiment_id)
+
+    def get_experiment_by_name(self, name):
+        self.calls.append(('by_name', name))
+        for experiment in self.experiments.values():
+            if experiment.name == name and experiment.lifecycle_stage == 'active':
+                return experiment
+        return None
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    monkeypatch.setattr(mlflow_manager, '_EXPERIMENT_CACHE_PATH', tmp_path / 'cache' / 'experiments.json')
+    return FakeTrackingServer(monkeypatch)
+
+
+def _manager(tracking_uri, experiment_name='exp'):
+    manager = object.__new__(MLflowManager)
+    manager.tracking_uri = tracking_uri
+    manager.experiment_name = experiment_name
+    manager._experiment_id = manager._resolve_experiment_id()
+    return manager
+
+
+@pytest.mark.parametrize('tracking_uri', ['file:/tmp/mlruns', 'sqlite:///mlflow.db', 'databricks'])
+def test_experiment_ids_of_local_backends_are_not_cached(server, tracking_uri):
+    _manager(tracking_uri)
+
+    assert not mlflow_manager._EXPERIMENT_CACHE_PATH.exists()
+    assert _manager(tracking_uri).experiment_id == '1'
+    assert server.calls.count(('by_name', 'exp')) == 2
+
+
+def test_cached_remote_experiment_id_is_checked_on_first_use(server):
+    uri = 'https://mlflow.example.com'
+    first = _manager(uri)
+    assert json.loads(mlflow_manager._EXPERIMENT_CACHE_PATH.read_text()) == {uri: {'exp': '1'}}
+    assert [p.name for p in mlflow_manager._EXPERIMENT_CACHE_PATH.parent.iterdir()] == ['experiments.json']
+
+    server.calls.clear()
+    second = _manager(uri)
+    assert server.calls == []
+
+    assert second.experiment_id == '1'
+    assert second.experiment_id == '1'
+    assert second.experiment is first.experiment
+    assert server.calls == [('get', '1')]
+
+
+def test_stale_cached_experiment_id_is_replaced(server):
+    uri = 'https://mlflow.example.com'
+    _manager(uri)
+
+    # Server reset: the cached ID now belongs to another experiment
+    server.experiments.clear()
+    server.create_experiment('someone-else')
+    manager = _manager(uri)
+
+    assert manager.experiment_id == '2'
+    assert manager.experiment.name == 'exp'
+    assert json.loads(mlflow_manager._EXPERIMENT_CACHE_PATH.read_text()) == {uri: {'exp': '2'}}
+
+
+class FakeClient:
+    """Records log_batch requests; rejects param overwrites like a tracking server"""
+
+    def __init__(self):
+        self.requests = []
+        self.params = {}
+
+    def log_batch(self, run_id, metrics=(), params=(), tags=()):
+        for param in params:
+            if self.params.get((run_id, param.key), param.value) != param.value:
+                raise MlflowException(f'Changing param values is not allowed: {param.key}')
+        for param in params:
+            self.params[run_id, param.key] = param.value
+        self.requests.append((
+            run_id,
+            [metric.key for metric in metrics],
+            [param.key for param in params],
+            [tag.key for tag in tags],
+        ))
+
+    def get_run(self, run_id):
+        return run_id
+
+    def sent(self, run_id):
+        """Metric, param and tag keys sent for a run, in request order"""
+        return [key for rid, *keys in self.requests if rid == run_id for group in keys for key in group]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """FakeClient behind a manager whose runs are stand-ins (no tracking store is touched)"""
+    client = FakeClient()
+    active = []
+
+    def start_run(experiment_id=None, run_name=None, tags=None):
+        run = types.SimpleNamespace(
+            info=types.SimpleNamespace(run_id=f'run{len(client.requests)}-{time.monotonic_ns()}'),
+            data=types.SimpleNamespace(metrics={}, params={}, tags={}),
+            inputs=None,
+            outputs=None,
+        )
+        active.append(run)
+        return run
+
+    def resolve(self, use_cache=True):
+        self._experiment_from_cache = False
+        return '0'
+
+    monkeypatch.setattr(mlflow_manager.mlflow, 'set_tracking_uri', lambda uri: None)
+    monkeypatch.setattr(mlflow_manager.mlflow, 'start_run', start_run)
+    monkeypatch.setattr(mlflow_manager.mlflow, 'active_run', lambda: active[-1] if active else None)
+    monkeypatch.setattr(MLflowManager, '_resolve_experiment_id', resolve)
+    monkeypatch.setattr(mlflow_manager, 'MlflowClient', lambda tracking_uri=None: client)
+    # A long coalescing window: anything sent promptly was flushed, not timed out
+    monkeypatch.setattr(
+        mlflow_manager, '_AsyncMlflowWorker',
+        functools.partial(mlflow_manager._AsyncMlflowWorker, coalesce_seconds=5)
+    )
+    return client
+
+
+def test_logs_are_coalesced_into_few_requests(client):
+    manager = MLflowManager()
+    with manager.start_run() as run:
+        for step in range(2000):
+            manager.log_metric('loss', 1.0 / (step + 1), step=step)
+        manager.log_params({'lr': 0.1, 'depth': 3})
+        manager.set_tags({'stage': 'test'})
+
+    run_id = run.info.run_id
+    assert sum(len(metrics) for rid, metrics, _, _ in client.requests if rid == run_id) == 2000
+    assert len(client.requests) <= 4
+    assert client.params == {(run_id, 'lr'): '0.1', (run_id, 'depth'): '3'}
+
+
+def test_run_exit_sends_everything_without_waiting_out_the_window(client):
+    manager = MLflowManager()
+    start = time.monotonic()
+    with manager.start_run() as run:
+        manager.log_metrics({'a': 1.0, 'b': 2.0})
+        manager.set_tags({'t': 'x'})
+
+    assert time.monotonic() - start < 2
+    assert sorted(client.sent(run.info.run_id)) == ['a', 'b', 't']
+
+
+def test_rejected_param_fails_the_run_and_drops_later_logs(client):
+    manager = MLflowManager()
+    with pytest.raises(MlflowException, match='depth'):
+        with manager.start_run() as run:
+            manager.log_metric('before', 1.0)
+            manager.log_params({'lr': 0.1, 'depth': 3})
+            manager.log_metric('between', 2.0)
+            manager.log_params({'depth': 4, 'seed': 1})
+            manager.log_metric('after', 3.0)
+            # Unrelated calls do not surface the failure
+            manager.get_run(run.info.run_id)
+            manager.log_metric('still_after', 4.0)
+
+    # Everything logged before the failing call landed, in order; nothing after it
+    assert client.sent(run.info.run_id) == ['before', 'lr', 'depth', 'between', 'seed']
+
+    # The error belonged to that run and was cleared when it was raised
+    manager.flush(wait=True)
+    with manager.start_run() as next_run:
+        manager.log_metric('after', 1.0)
+    assert client.sent(next_run.info.run_id) == ['after']
+
+
+def test_explicit_flush_raises_failures_of_runs_without_a_context_manager(client):
+    manager = MLflowManager()
+    manager.start_run()
+    manager.log_params({'lr': 0.1})
+    manager.flush(wait=True)
+    manager.log_params({'lr': 0.2})
+
+    with pytest.raises(MlflowException):
+        manager.flush(wait=True)
+    manager.flush(wait=True)
+
+
+def test_managers_are_not_kept_alive_by_the_exit_hook(client):
+    manager = MLflowManager()
+    manager.start_run()
+    manager.log_metric('loss', 1.0)
+    manager.flush(wait=True)
+    worker_thread = manager._worker._thread
+    ref = weakref.ref(manager)
+
+    del manager
+    gc.collect()
+
+    assert ref() is None
+    worker_thread.join(timeout=5)
+    assert not worker_thread.is_alive()
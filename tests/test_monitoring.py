@@ -0,0 +1,112 @@
+"""
+Tests for lisa.core.monitoring
+"""
+
+import numpy as np
+import pytest
+
+from lisa.core.monitoring import TrainingMonitor
+
+
+def test_history_attributes_are_lists():
+    monitor = TrainingMonitor()
+    assert not monitor.epochs
+
+    for epoch in range(5):
+        monitor.log_epoch(epoch, 0.5 + epoch * 0.01, 0.4 + epoch * 0.01, learning_rate=0.1)
+
+    assert monitor.epochs == [0, 1, 2, 3, 4]
+    assert all(isinstance(epoch, int) for epoch in monitor.epochs)
+    assert monitor.val_metrics[-1] == 0.44
+    assert monitor.learning_rates == [0.1] * 5
+    assert monitor.get_status()['total_epochs'] == 5
+
+
+def test_reset_does_not_touch_lists_held_by_callers():
+    monitor = TrainingMonitor()
+    monitor.log_epoch(0, 0.5, 0.4)
+    held = monitor.epochs
+
+    monitor.reset()
+    monitor.log_epoch(7, 0.9, 0.8)
+
+    assert held == [0]
+    assert monitor.epochs == [7]
+    assert monitor.get_status()['latest_val_metric'] == 0.8
+
+
+def test_get_status_follows_threshold_changes():
+    monitor = TrainingMonitor(patience=10)
+    for epoch, val in enumerate([0.5, 0.4, 0.4, 0.4]):
+        monitor.log_epoch(epoch, 0.6, val)
+
+    assert not monitor.get_status()['should_stop']
+
+    monitor.patience = 2
+    status = monitor.get_status()
+
+    assert status['should_stop']
+    assert 'No improvement for 2 epochs' in status['stop_reasoning']
+
+
+def test_get_status_returns_independent_copies():
+    monitor = TrainingMonitor()
+    monitor.log_epoch(0, 0.5, 0.4)
+    monitor.log_epoch(1, float('nan'), 0.4)
+
+    first = monitor.get_status()
+    assert first['has_anomaly']
+    first['anomaly_issues'].append('edited by caller')
+
+    assert 'edited by caller' not in monitor.get_status()['anomaly_issues']
+
+
+def test_checks_follow_edits_to_the_public_lists():
+    monitor = TrainingMonitor(convergence_window=3)
+    for epoch in range(4):
+        monitor.log_epoch(epoch, float('nan') if epoch == 1 else 0.5, 0.4)
+
+    assert monitor.check_convergence()[0]
+    assert monitor.get_status()['has_anomaly']
+
+    monitor.train_metrics.clear()
+    monitor.val_metrics.clear()
+    monitor.log_epoch(4, 0.9, 0.5)
+
+    status = monitor.get_status()
+    assert not status['has_anomaly']
+    assert status['convergence_reasoning'] == "Not enough data for convergence check"
+    assert status['latest_train_metric'] == 0.9
+    assert "0.4000" in status['overfitting_reasoning']
+
+
+def test_convergence_window_can_change_after_logging():
+    monitor = TrainingMonitor(convergence_window=3)
+    for epoch in range(5):
+        monitor.log_epoch(epoch, 0.5, 0.4)
+
+    assert monitor.check_convergence()[0]
+
+    monitor.convergence_window = 8
+    assert not monitor.check_convergence()[0]
+    for epoch in range(5, 8):
+        monitor.log_epoch(epoch, 0.5, 0.4)
+
+    converged, reason = monitor.check_convergence()
+    assert converged
+    assert "variance 0.000000" in reason
+
+
+def test_convergence_variance_matches_np_var():
+    rng = np.random.default_rng(0)
+    # Large values replaced by small ones exercise the rounding-noise rebuild
+    values = np.r_[rng.normal(0.0, 100.0, 20), rng.normal(0.8, 1e-3, 30)]
+    monitor = TrainingMonitor(convergence_window=5, convergence_threshold=0.0)
+
+    for epoch, value in enumerate(values):
+        monitor.log_epoch(epoch, 0.9, float(value))
+        if epoch + 1 < 5:
+            continue
+        monitor.check_convergence()
+        variance = max(monitor._window_m2, 0.0) / monitor._window_len
+        assert variance == pytest.approx(np.var(values[epoch - 4:epoch + 1]), rel=1e-6, abs=1e-12)
@@ -0,0 +1,19 @@
+"""
+Tests for the lisa package namespace
+"""
+
+import types
+
+import lisa
+
+
+def test_config_attribute_is_the_singleton():
+    from lisa import config
+
+    assert isinstance(lisa.config, lisa.Config)
+    assert config is lisa.Config()
+
+
+def test_mlflow_manager_attribute_is_not_the_submodule():
+    assert not isinstance(vars(lisa).get('mlflow_manager'), types.ModuleType)
+    assert 'mlflow_manager' in lisa.__all__
@@ -0,0 +1,107 @@
+"""
+Tests for lisa.core.stopping
+"""
+
+import numpy as np
+import pytest
+
+from lisa.core import _stopping_kernels as kernels
+from lisa.core.stopping import StoppingCriteria
+
+CONFIG = {
+    'performance': {'enabled': True, 'metric': 'f1_score', 'threshold': 0.95},
+    'improvement': {'enabled': False},
+    'convergence': {'enabled': True, 'max_variance': 0.0001, 'window_size': 3},
+    'resources': {'enabled': False},
+}
+
+
+def _summary(stopping, history):
+    report = stopping.generate_stopping_report(history)
+    return (
+        report['should_stop'],
+        report['reasoning'],
+        report['statistics']['best_value'],
+        report['statistics']['mean_value'],
+        report['best_experiment'] is None or history.index(report['best_experiment']),
+    )
+
+
+def test_cached_results_match_a_fresh_evaluation_on_slices():
+    rng = np.random.default_rng(0)
+    history = [{'metrics': {'f1_score': float(v)}} for v in rng.uniform(0.5, 0.9, 40)]
+    stopping = StoppingCriteria(CONFIG)
+
+    # Alternate between the full history and prefixes of it, as a caller
+    # replaying the campaign would
+    for end in range(1, len(history) + 1):
+        for part in (history, history[:end], history[:end // 2]):
+            assert _summary(stopping, part) == _summary(StoppingCriteria(CONFIG), part)
+
+
+def test_decisions_follow_in_place_edits_and_appends():
+    history = [{'metrics': {'f1_score': v}} for v in (0.5, 0.6, 0.55)]
+    stopping = StoppingCriteria(CONFIG)
+    assert stopping.should_stop_campaign(history)[2] == 'CONTINUE'
+    assert stopping.get_best_experiment(history) is history[1]
+
+    history[0]['metrics']['f1_score'] = 0.97
+    report = stopping.generate_stopping_report(history)
+
+    assert report['should_stop'] and report['next_action'] == 'STOP'
+    assert report['best_experiment'] is history[0]
+    assert report['statistics']['best_value'] == 0.97
+
+    history.append({'metrics': {'f1_score': 0.99}})
+    assert stopping.get_best_experiment(history) is history[3]
+    assert stopping.generate_stopping_report(history)['statistics']['best_value'] == 0.99
+
+
+def test_nan_metrics_are_never_best():
+    nan = float('nan')
+    history = [{'metrics': {'f1_score': v}} for v in (nan, 0.96, nan, 0.7)]
+    stopping = StoppingCriteria(CONFIG)
+
+    assert stopping.get_best_experiment(history) is history[1]
+    result = stopping.evaluate_all(history)
+    assert result['threshold_met']
+    assert 'f1_score=0.9600' in result['reasons'][0]
+
+    all_nan = [{'metrics': {'f1_score': nan}} for _ in range(3)]
+    assert stopping.get_best_experiment(all_nan) is None
+    assert not stopping.evaluate_all(all_nan)['threshold_met']
+
+
+@pytest.mark.parametrize('window_size', [1, 3, 10, 100])
+def test_window_variance_matches_np_var(window_size):
+    rng = np.random.default_rng(0)
+    # A large offset with a tiny spread, and some experiments without the metric
+    history = [
+        {'metrics': {'f1_score': float(v)} if i % 5 else {}}
+        for i, v in enumerate(rng.normal(1e3, 0.01, 60))
+    ]
+    stopping = StoppingCriteria(CONFIG)
+
+    for end in range(1, len(history) + 1):
+        part = history[:end]
+        expected = [exp['metrics']['f1_score'] for exp in part[-window_size:] if exp['metrics']]
+        count, variance = stopping._window_variance(part, 'f1_score', window_size)
+
+        assert count == len(expected)
+        if expected:
+            assert variance == pytest.approx(np.var(expected), rel=1e-9, abs=1e-18)
+        else:
+            assert np.isnan(variance)
+
+
+@pytest.mark.parametrize('moments', [
+    kernels._window_moments_numpy,
+    pytest.param(kernels.window_moments, marks=pytest.mark.skipif(
+        not kernels.HAS_NUMBA, reason="numba is not installed")),
+])
+def test_window_moments_kernels_match_numpy(moments):
+    rng = np.random.default_rng(1)
+    for values in (rng.normal(0.8, 0.05, 7), rng.normal(1e6, 1e-3, 50), np.array([0.5])):
+        mean, m2 = moments(values)
+        assert mean == pytest.approx(np.mean(values), rel=1e-12)
+        assert m2 / len(values) == pytest.approx(np.var(values), rel=1e-9, abs=1e-18)
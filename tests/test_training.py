@@ -0,0 +1,78 @@
+"""
+Tests for lisa.core.training
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.model_selection import train_test_split
+
+from lisa.core import training
+from lisa.core.training import ModelTrainer
+
+
+def test_prepare_data_matches_train_test_split():
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(size=(100, 3)), index=rng.permutation(100) + 1000)
+    y = pd.Series(rng.integers(0, 2, 100), index=X.index)
+
+    X_train, X_val, X_test, y_train, y_val, y_test = ModelTrainer(verbose=False).prepare_data(X, y)
+    _, expected_test = train_test_split(X, test_size=0.2, random_state=42, stratify=y)
+
+    assert list(X_test.index) == list(expected_test.index)
+    assert list(y_train.index) == list(X_train.index)
+    assert sorted(X_train.index.union(X_val.index).union(X_test.index)) == sorted(X.index)
+
+    arrays = ModelTrainer(verbose=False).prepare_data(X.to_numpy(), y.to_numpy())
+    assert all(isinstance(part, np.ndarray) for part in arrays)
+    np.testing.assert_array_equal(arrays[2], X_test.to_numpy())
+
+
+def test_train_sees_in_place_changes_to_features():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = (X[:, 0] > 0).astype(int)
+    trainer = ModelTrainer(verbose=False)
+    params = {'n_estimators': 5, 'random_state': 0}
+
+    trainer.train('random_forest', X, y, params=params)
+    assert trainer.model.feature_importances_.argmax() == 0
+
+    # Same array object, new contents: the label now follows the last column
+    X[:, 0] = 0.0
+    X[:, 2] = np.where(y == 1, 1.0, -1.0)
+    results = trainer.train('random_forest', X, y, params=params)
+
+    assert trainer.model.feature_importances_.argmax() == 2
+    assert results['train_score'] == 1.0
+
+
+def _checkpoint_metadata(tmp_path, monkeypatch, use_orjson):
+    monkeypatch.setattr(training, 'HAS_ORJSON', use_orjson)
+    trainer = ModelTrainer(verbose=False)
+    trainer.model = object()
+    trainer.training_history = {'logloss': [0.5, float('nan'), np.float32(0.25)]}
+    path = tmp_path / ('orjson' if use_orjson else 'json') / 'model'
+
+    trainer.save_checkpoint(path, metadata={'best': float('inf'), 'scores': np.array([1.0, np.nan])})
+
+    return path.with_suffix('.json').read_text()
+
+
+def test_checkpoint_metadata_stores_non_finite_values_as_null(tmp_path, monkeypatch):
+    text = _checkpoint_metadata(tmp_path, monkeypatch, use_orjson=False)
+
+    data = json.loads(text, parse_constant=lambda name: pytest.fail(f'non-standard JSON token {name}'))
+    assert data['training_history'] == {'logloss': [0.5, None, 0.25]}
+    assert data['metadata'] == {'best': None, 'scores': [1.0, None]}
+
+
+def test_checkpoint_metadata_is_the_same_with_orjson(tmp_path, monkeypatch):
+    pytest.importorskip('orjson')
+
+    with_json = _checkpoint_metadata(tmp_path, monkeypatch, use_orjson=False)
+    with_orjson = _checkpoint_metadata(tmp_path, monkeypatch, use_orjson=True)
+
+    assert json.loads(with_orjson) == json.loads(with_json)
@@ -0,0 +1,98 @@
+"""
+Tests for lisa.visualizer
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.metrics import auc, average_precision_score, precision_recall_curve, roc_curve
+
+from lisa import visualizer
+from lisa.visualizer import Visualizer, _ovr_counts, _pr_from_counts, _roc_from_counts
+
+
+@pytest.fixture
+def viz(tmp_path):
+    return Visualizer(tmp_path)
+
+
+def _plotted_features(viz, n_features):
+    ax = viz._fig_cache[(10, max(6, n_features * 0.3))].axes[0]
+    return [label.get_text() for label in ax.get_yticklabels()]
+
+
+def test_feature_importance_top_n_matches_sorted_order(viz):
+    rng = np.random.default_rng(0)
+    importance = {f'f{i}': float(v) for i, v in enumerate(rng.choice([-2, -1, 0.5, 1, 3], 40))}
+
+    viz.plot_feature_importance(importance, top_n=10)
+
+    expected = sorted(importance, key=lambda name: abs(importance[name]), reverse=True)[:10]
+    assert _plotted_features(viz, 10) == expected
+
+
+def test_feature_importance_ranks_nan_last(viz):
+    viz.plot_feature_importance({'a': np.nan, 'b': 1.0, 'c': 0.5}, top_n=2)
+    assert _plotted_features(viz, 2) == ['b', 'c']
+
+    viz.plot_feature_importance({'a': np.nan, 'b': -1.0, 'c': np.nan}, top_n=2)
+    assert _plotted_features(viz, 2) == ['b', 'a']
+
+
+def _ovr_cases():
+    rng = np.random.default_rng(0)
+    n = 300
+    # Rounded scores give tied thresholds; labels are not {0, 1} on purpose
+    binary = rng.choice([3, 7], n)
+    binary_proba = np.round(rng.uniform(size=n), 2)
+    binary_proba = np.column_stack([1 - binary_proba, binary_proba])
+
+    multi = rng.choice(['a', 'b', 'c'], n)
+    multi_proba = np.round(rng.dirichlet(np.ones(3), n), 2)
+    return [(binary, binary_proba), (multi, multi_proba)]
+
+
+@pytest.mark.parametrize('y_true, y_pred_proba', _ovr_cases())
+def test_roc_and_pr_match_sklearn(y_true, y_pred_proba):
+    classes, curves = _ovr_counts(y_true, y_pred_proba)
+    columns = [1] if len(classes) == 2 else range(len(classes))
+
+    for counts, j in zip(curves, columns):
+        y_bin = y_true == classes[j]
+        scores = y_pred_proba[:, j]
+
+        fpr, tpr = _roc_from_counts(*counts)
+        expected_fpr, expected_tpr, _ = roc_curve(y_bin, scores)
+        np.testing.assert_allclose(fpr, expected_fpr)
+        np.testing.assert_allclose(tpr, expected_tpr)
+        assert auc(fpr, tpr) == pytest.approx(auc(expected_fpr, expected_tpr))
+
+        precision, recall, ap = _pr_from_counts(*counts)
+        expected_precision, expected_recall, _ = precision_recall_curve(y_bin, scores)
+        np.testing.assert_allclose(precision, expected_precision)
+        np.testing.assert_allclose(recall, expected_recall)
+        assert ap == pytest.approx(average_precision_score(y_bin, scores))
+
+
+@pytest.mark.parametrize('with_nan', [False, True])
+def test_correlation_heatmap_matches_pandas(viz, monkeypatch, with_nan):
+    rng = np.random.default_rng(0)
+    n = 100
+    df = pd.DataFrame({
+        'x': rng.normal(size=n),
+        'timestamp': 1.7e9 + rng.normal(0, 3600, n),
+        'count': rng.integers(0, 10, n),
+        'constant': np.ones(n),
+        'label': rng.choice(['a', 'b'], n),
+    })
+    df['y'] = df['x'] * 2 + rng.normal(0, 0.1, n)
+    if with_nan:
+        df.loc[::9, 'x'] = np.nan
+
+    plotted = []
+    monkeypatch.setattr(visualizer.sns, 'heatmap', lambda corr, **kwargs: plotted.append(corr))
+    viz.plot_correlation_heatmap(df)
+
+    # pandas rounds slightly worse on the offset column; float32 would be off by ~1e-3
+    expected = df.select_dtypes(include=[np.number]).corr()
+    pd.testing.assert_frame_equal(plotted[0], expected, rtol=0, atol=1e-9)